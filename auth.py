@@ -4,7 +4,7 @@ Authentication module for the University Course Registration System.
 CS 236: Data Structures and Algorithms - Final Lab Assignment #5
 
 This module handles user authentication, password management, and user roles.
-Uses SHA-256 hashing for secure password storage and validates unique Student IDs.
+Uses salted scrypt hashing for secure password storage and validates unique Student IDs.
 Implements CSV file persistence for user credentials.
 
 Author: Jonathan
@@ -12,10 +12,78 @@ Date: 10/24/2025
 """
 
 import hashlib
+import hmac
 import csv
 import os
-from typing import Optional, Tuple
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
+from csv_loader import IO_BUFFER_SIZE, read_rows
+
+
+# scrypt parameters: N = 2 ** cost. The cost is calibrated once per process so
+# that a single hash takes roughly KDF_TARGET_SECONDS on the current machine.
+KDF_TARGET_SECONDS = 0.1
+_KDF_MIN_COST = 14
+_KDF_MAX_COST = 17
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SALT_BYTES = 16
+
+_kdf_cost: Optional[int] = None
+
+# hashlib is backed by OpenSSL, which already picks SHA-NI/AVX2 code at runtime
+# on CPUs that support it; binding it once skips the module attribute lookup.
+_sha256 = hashlib.sha256
+
+# How long (seconds) a successful verification can be reused by login()
+VERIFY_CACHE_TTL = 600
+
+# Column order of users_auth.csv
+USERS_FIELDNAMES = ['username', 'password_hash', 'role', 'student_id', 'salt', 'kdf_cost']
+
+# Password changes are appended to a log next to the CSV (users_auth.log)
+# between full rewrites, and folded back in once the log exceeds this
+# fraction of the CSV's size
+PASSWORD_LOG_COMPACT_RATIO = 0.25
+
+# Credential files with these extensions are stored in SQLite instead of CSV
+SQLITE_EXTENSIONS = ('.sqlite', '.db')
+
+# Smallest batch for which bulk_register hashes passwords on a thread pool
+BULK_HASH_MIN_ROWS = 4
+
+# Memory bulk_register's parallel hashes may use together (each scrypt hash
+# needs 128 * r * N bytes: 16 MiB at the minimum cost, 128 MiB at the maximum)
+BULK_HASH_MEMORY_BUDGET = 512 * 1024 * 1024
+
+
+def get_kdf_cost() -> int:
+    """
+    Get the scrypt cost (log2 of N) used for newly hashed passwords.
+
+    The first call times one hash at the minimum cost and picks the largest
+    cost whose estimated hash time stays within KDF_TARGET_SECONDS. Each step
+    up in cost doubles the work, so the estimate only needs one measurement.
+
+    Returns:
+        Cost parameter for hashlib.scrypt
+    """
+    global _kdf_cost
+    if _kdf_cost is None:
+        start = time.perf_counter()
+        User._hash_password("calibration", os.urandom(_SALT_BYTES), _KDF_MIN_COST)
+        elapsed = time.perf_counter() - start
+
+        cost = _KDF_MIN_COST
+        while cost < _KDF_MAX_COST and elapsed * 2 <= KDF_TARGET_SECONDS:
+            cost += 1
+            elapsed *= 2
+        _kdf_cost = cost
+    return _kdf_cost
 
 
 class UserRole(Enum):
@@ -27,20 +95,30 @@ class UserRole(Enum):
 class User:
     """Represents a user in the authentication system."""
 
-    def __init__(self, username: str, password_hash: str, role: UserRole, student_id: Optional[str] = None):
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ('username', 'password_hash', 'role', 'role_str', 'student_id', 'salt', 'kdf_cost')
+
+    def __init__(self, username: str, password_hash: bytes, role: UserRole, student_id: Optional[str] = None,
+                 salt: bytes = b"", kdf_cost: int = 0):
         """
         Initialize a User object.
 
         Args:
             username: Username for login
-            password_hash: Hashed password
+            password_hash: Hashed password (raw digest bytes; hex-encoded only on disk)
             role: User role (STUDENT or ADMIN)
             student_id: Student ID if the user is a student
+            salt: Per-user random salt (empty for legacy unsalted SHA-256 hashes)
+            kdf_cost: scrypt cost the hash was computed with
         """
         self.username = username
         self.password_hash = password_hash
         self.role = role
+        # Plain-string copy of role.value, written directly when saving
+        self.role_str = role.value
         self.student_id = student_id
+        self.salt = salt
+        self.kdf_cost = kdf_cost
 
     def check_password(self, password: str) -> bool:
         """
@@ -52,35 +130,85 @@ class User:
         Returns:
             True if password matches, False otherwise
         """
-        return self.password_hash == self._hash_password(password)
+        return hmac.compare_digest(self.password_hash, self._hash_password(password, self.salt, self.kdf_cost))
+
+    def set_password(self, password: str) -> None:
+        """
+        Hash and store a new password with a fresh salt at the current cost.
+
+        Args:
+            password: Plain text password
+        """
+        self.salt = os.urandom(_SALT_BYTES)
+        self.kdf_cost = get_kdf_cost()
+        self.password_hash = self._hash_password(password, self.salt, self.kdf_cost)
+
+    def needs_rehash(self) -> bool:
+        """
+        Check if the stored hash is legacy or weaker than the current cost.
+
+        Returns:
+            True if the password should be rehashed on the next successful login
+        """
+        return not self.salt or self.kdf_cost < get_kdf_cost()
 
     @staticmethod
-    def _hash_password(password: str) -> str:
+    def _hash_password(password: str, salt: bytes, cost: int) -> bytes:
         """
-        Hash a password using SHA-256.
+        Hash a password using salted scrypt.
 
         Args:
             password: Plain text password
+            salt: Random per-user salt (empty selects legacy unsalted SHA-256)
+            cost: scrypt cost, N = 2 ** cost
 
         Returns:
-            Hashed password
+            Raw password digest
         """
-        return hashlib.sha256(password.encode()).hexdigest()
+        if not salt:
+            return _sha256(password.encode()).digest()
+        n = 1 << cost
+        return hashlib.scrypt(
+            password.encode(),
+            salt=salt,
+            n=n,
+            r=_SCRYPT_R,
+            p=_SCRYPT_P,
+            maxmem=2 * 128 * _SCRYPT_R * n,
+            dklen=32
+        )
 
 
 class AuthenticationSystem:
     """Manages user authentication and credentials."""
 
-    def __init__(self, data_directory: str = "."):
+    def __init__(self, data_directory: str = ".", users_file: str = "users_auth.csv"):
         """
         Initialize the authentication system.
 
         Args:
             data_directory: Directory where user credentials are stored
+            users_file: Credentials file name; a .sqlite or .db extension selects SQLite storage
         """
         self.data_directory = data_directory
+        self.users_file = users_file
+        self._password_log = os.path.splitext(users_file)[0] + '.log'
+        self._db: Optional[sqlite3.Connection] = None
         self.users = {}
+        # student_id -> username, so duplicate Student ID checks are O(1)
+        self.student_id_index: Dict[str, str] = {}
         self.current_user: Optional[User] = None
+        # username -> (sha256 of username+password, time verified); lets repeat
+        # logins skip the slow KDF while the entry is fresh
+        self.verify_cache_enabled = True
+        self._verify_cache: Dict[str, Tuple[bytes, float]] = {}
+        # Salt for the throwaway hash run for unknown usernames and failed legacy checks
+        self._dummy_salt = os.urandom(_SALT_BYTES)
+        # False until users_auth.csv is known to have the current header, so
+        # rows can safely be appended to it
+        self._users_file_current = False
+        # Calibrate the KDF cost up front so the first login doesn't pay for it
+        get_kdf_cost()
         self.load_users()
 
         # Create default admin account if no users exist
@@ -91,63 +219,236 @@ class AuthenticationSystem:
         """Get the full path for a data file."""
         return os.path.join(self.data_directory, filename)
 
+    def _uses_sqlite(self) -> bool:
+        """Check if credentials are stored in SQLite rather than CSV."""
+        return self.users_file.endswith(SQLITE_EXTENSIONS)
+
+    def _get_db(self) -> sqlite3.Connection:
+        """Open (once) the SQLite credentials database, creating the table if needed."""
+        if self._db is None:
+            self._db = sqlite3.connect(self._get_file_path(self.users_file))
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS users ("
+                    "username TEXT PRIMARY KEY, password_hash BLOB, role TEXT, "
+                    "student_id TEXT, salt BLOB, kdf_cost INTEGER)"
+                )
+                self._db.execute("CREATE INDEX IF NOT EXISTS users_student_id ON users(student_id)")
+        return self._db
+
     def load_users(self) -> None:
-        """Load user credentials from CSV file."""
-        users_file = self._get_file_path('users_auth.csv')
+        """
+        Load user credentials from CSV file (or SQLite database).
+
+        Password changes recorded in the password log since the last full save
+        are replayed on top of the CSV.
+        """
+        if self._uses_sqlite():
+            self._load_users_sqlite()
+            return
+
+        users_file = self._get_file_path(self.users_file)
         if os.path.exists(users_file):
             try:
-                with open(users_file, 'r', newline='', encoding='utf-8') as file:
-                    reader = csv.DictReader(file)
-                    for row in reader:
-                        role = UserRole.STUDENT if row['role'] == 'student' else UserRole.ADMIN
-                        student_id = row.get('student_id', '') if row.get('student_id') else None
-                        user = User(
-                            row['username'],
-                            row['password_hash'],
-                            role,
-                            student_id
-                        )
-                        self.users[user.username] = user
+                # Large files are memory-mapped and parsed in parallel segments
+                header, rows = read_rows(users_file)
+                if not header:
+                    return
+                self._users_file_current = header == USERS_FIELDNAMES
+                # Resolve column positions once; salt/kdf_cost are absent in older files
+                idx = {name: i for i, name in enumerate(header)}
+                username_i = idx['username']
+                hash_i = idx['password_hash']
+                role_i = idx['role']
+                student_id_i = idx['student_id']
+                salt_i = idx.get('salt')
+                cost_i = idx.get('kdf_cost')
+                for row in rows:
+                    role = UserRole.STUDENT if row[role_i] == 'student' else UserRole.ADMIN
+                    salt = row[salt_i] if salt_i is not None else ''
+                    cost = row[cost_i] if cost_i is not None else ''
+                    # Interned so every copy of a Student ID shares one string object
+                    student_id = sys.intern(row[student_id_i]) if row[student_id_i] else None
+                    user = User(
+                        row[username_i],
+                        bytes.fromhex(row[hash_i]),
+                        role,
+                        student_id,
+                        bytes.fromhex(salt),
+                        int(cost or 0)
+                    )
+                    self.users[user.username] = user
+                    if user.student_id:
+                        self.student_id_index[user.student_id] = user.username
             except Exception as e:
                 print(f"Error loading users: {e}")
 
+            self._replay_password_log()
+
+    def _load_users_sqlite(self) -> None:
+        """Load user credentials from the SQLite database."""
+        try:
+            rows = self._get_db().execute(
+                "SELECT username, password_hash, role, student_id, salt, kdf_cost FROM users"
+            )
+            for username, password_hash, role, student_id, salt, cost in rows:
+                role = UserRole.STUDENT if role == 'student' else UserRole.ADMIN
+                student_id = sys.intern(student_id) if student_id else None
+                # Databases written before hashes were stored as bytes hold hex text
+                if isinstance(password_hash, str):
+                    password_hash = bytes.fromhex(password_hash)
+                self.users[username] = User(username, password_hash, role, student_id, salt or b"", cost or 0)
+                if student_id:
+                    self.student_id_index[student_id] = username
+        except Exception as e:
+            print(f"Error loading users: {e}")
+
+    def _replay_password_log(self) -> None:
+        """
+        Apply logged password changes, compacting the log if it has grown large.
+        """
+        log_file = self._get_file_path(self._password_log)
+        if not os.path.exists(log_file):
+            return
+
+        try:
+            with open(log_file, 'r', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+                for username, password_hash, salt, cost, _ in csv.reader(file):
+                    user = self.users.get(username)
+                    if user is not None:
+                        user.password_hash = bytes.fromhex(password_hash)
+                        user.salt = bytes.fromhex(salt)
+                        user.kdf_cost = int(cost or 0)
+        except Exception as e:
+            print(f"Error replaying password log: {e}")
+            return
+
+        users_size = os.path.getsize(self._get_file_path(self.users_file))
+        if os.path.getsize(log_file) > PASSWORD_LOG_COMPACT_RATIO * users_size:
+            self.save_users()
+
     def save_users(self) -> None:
-        """Save user credentials to CSV file."""
-        users_file = self._get_file_path('users_auth.csv')
+        """Save user credentials to CSV file (or SQLite database), folding in the password log."""
+        if self._uses_sqlite():
+            self._write_users_sqlite(self.users.values(), "INSERT OR REPLACE")
+            return
+
+        users_file = self._get_file_path(self.users_file)
         try:
-            with open(users_file, 'w', newline='', encoding='utf-8') as file:
-                fieldnames = ['username', 'password_hash', 'role', 'student_id']
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
+            # Write to a temporary file first so a crash never leaves a partial users file
+            temp_file = users_file + '.tmp'
+            with open(temp_file, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+                writer = csv.writer(file)
+                writer.writerow(USERS_FIELDNAMES)
                 for user in self.users.values():
-                    writer.writerow({
-                        'username': user.username,
-                        'password_hash': user.password_hash,
-                        'role': user.role.value,
-                        'student_id': user.student_id if user.student_id else ''
-                    })
+                    writer.writerow(self._user_row(user))
+            os.replace(temp_file, users_file)
+            self._users_file_current = True
+
+            # Every logged change is now in the CSV
+            log_file = self._get_file_path(self._password_log)
+            if os.path.exists(log_file):
+                os.remove(log_file)
+        except Exception as e:
+            print(f"Error saving users: {e}")
+
+    def _append_users(self, users: List[User]) -> None:
+        """
+        Append new users to the CSV without rewriting existing rows.
+
+        Args:
+            users: Users that are not yet in the file
+        """
+        if self._uses_sqlite():
+            self._write_users_sqlite(users, "INSERT")
+            return
+
+        users_file = self._get_file_path(self.users_file)
+        if not self._users_file_current or not os.path.exists(users_file):
+            self.save_users()
+            return
+
+        try:
+            with open(users_file, 'a', newline='', encoding='utf-8') as file:
+                writer = csv.writer(file)
+                for user in users:
+                    writer.writerow(self._user_row(user))
+        except Exception as e:
+            print(f"Error saving users: {e}")
+
+    def _log_password_change(self, user: User) -> None:
+        """
+        Record a user's new password hash in the password log.
+
+        Args:
+            user: User whose password changed
+        """
+        if self._uses_sqlite():
+            try:
+                with self._get_db() as db:
+                    db.execute(
+                        "UPDATE users SET password_hash = ?, salt = ?, kdf_cost = ? WHERE username = ?",
+                        (user.password_hash, user.salt, user.kdf_cost, user.username)
+                    )
+            except Exception as e:
+                print(f"Error saving password change: {e}")
+            return
+
+        log_file = self._get_file_path(self._password_log)
+        try:
+            with open(log_file, 'a', newline='', encoding='utf-8') as file:
+                csv.writer(file).writerow([
+                    user.username,
+                    user.password_hash.hex(),
+                    user.salt.hex(),
+                    user.kdf_cost if user.salt else '',
+                    f"{time.time():.0f}"
+                ])
+        except Exception as e:
+            print(f"Error saving password change: {e}")
+
+    def _write_users_sqlite(self, users, statement: str) -> None:
+        """
+        Write users to the SQLite database in a single transaction.
+
+        Args:
+            users: Users to write
+            statement: "INSERT" for new users, "INSERT OR REPLACE" to overwrite
+        """
+        try:
+            with self._get_db() as db:
+                db.executemany(
+                    f"{statement} INTO users (username, password_hash, role, student_id, salt, kdf_cost) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(u.username, u.password_hash, u.role_str, u.student_id, u.salt, u.kdf_cost) for u in users]
+                )
         except Exception as e:
             print(f"Error saving users: {e}")
 
+    @staticmethod
+    def _user_row(user: User) -> list:
+        """Build a users_auth.csv row in USERS_FIELDNAMES order."""
+        return [
+            user.username,
+            user.password_hash.hex(),
+            user.role_str,
+            user.student_id or '',
+            user.salt.hex(),
+            user.kdf_cost if user.salt else ''
+        ]
+
     def _create_default_accounts(self) -> None:
         """Create default admin and demo accounts."""
         # Create admin account
-        admin = User(
-            "admin",
-            User._hash_password("admin123"),
-            UserRole.ADMIN,
-            None
-        )
+        admin = User("admin", b"", UserRole.ADMIN, None)
+        admin.set_password("admin123")
         self.users["admin"] = admin
 
         # Create a demo student account
-        student = User(
-            "student",
-            User._hash_password("student123"),
-            UserRole.STUDENT,
-            "S001"
-        )
+        student = User("student", b"", UserRole.STUDENT, "S001")
+        student.set_password("student123")
         self.users["student"] = student
+        self.student_id_index["S001"] = "student"
 
         self.save_users()
 
@@ -165,18 +466,58 @@ class AuthenticationSystem:
         if not username or not password:
             return False, "Username and password cannot be empty.", None
 
-        if username not in self.users:
+        user = self.users.get(username)
+        if user is None:
+            # Spend the same KDF time as a real check so response timing
+            # doesn't reveal whether the username exists
+            User._hash_password(password, self._dummy_salt, get_kdf_cost())
             return False, "Invalid username or password.", None
 
-        user = self.users[username]
-        if not user.check_password(password):
+        if not self._check_cached(user, password):
             return False, "Invalid username or password.", None
 
         self.current_user = user
         return True, f"Welcome, {username}!", user
 
+    def _check_cached(self, user: User, password: str) -> bool:
+        """
+        Verify a password, reusing a recent successful verification if possible.
+
+        Args:
+            user: User to verify
+            password: Plain text password
+
+        Returns:
+            True if password matches, False otherwise
+        """
+        key = _sha256(user.username.encode() + b"\0" + password.encode()).digest()
+        now = time.monotonic()
+
+        if self.verify_cache_enabled:
+            cached = self._verify_cache.get(user.username)
+            if cached and now - cached[1] < VERIFY_CACHE_TTL and hmac.compare_digest(cached[0], key):
+                return True
+
+        if not user.check_password(password):
+            if not user.salt:
+                # A legacy check is one fast SHA-256; spend the same KDF time as
+                # login() does for an unknown username so timing reveals nothing
+                User._hash_password(password, self._dummy_salt, get_kdf_cost())
+            return False
+
+        # Upgrade legacy or under-cost hashes now that we know the password
+        if user.needs_rehash():
+            user.set_password(password)
+            self._log_password_change(user)
+
+        if self.verify_cache_enabled:
+            self._verify_cache[user.username] = (key, now)
+        return True
+
     def logout(self) -> None:
         """Log out the current user."""
+        if self.current_user is not None:
+            self._verify_cache.pop(self.current_user.username, None)
         self.current_user = None
 
     def register_user(self, username: str, password: str, role: UserRole, student_id: Optional[str] = None) -> Tuple[bool, str]:
@@ -192,34 +533,115 @@ class AuthenticationSystem:
         Returns:
             Tuple of (success: bool, message: str)
         """
+        error = self._validate_registration(username, password, role, student_id)
+        if error:
+            return False, error
+
+        user = User(username, b"", role, student_id)
+        user.set_password(password)
+        self.users[username] = user
+        if student_id:
+            self.student_id_index[student_id] = username
+        self._append_users([user])
+
+        return True, f"User {username} registered successfully."
+
+    def bulk_register(self, rows: List[Dict[str, str]]) -> List[Tuple[bool, str]]:
+        """
+        Register many users at once, saving the credentials file a single time.
+
+        Rows are validated in order, so duplicates within the batch are caught.
+        hashlib.scrypt releases the GIL, so batches of BULK_HASH_MIN_ROWS or
+        more accepted rows are hashed in parallel on a thread pool, with no more
+        workers than CPUs or than BULK_HASH_MEMORY_BUDGET allows.
+
+        Args:
+            rows: Dicts with 'username', 'password', 'role' and 'student_id' keys
+
+        Returns:
+            List of (success: bool, message: str), one per row
+        """
+        results = []
+        accepted = []
+        # Usernames and Student IDs claimed by earlier rows of this batch
+        batch_usernames = set()
+        batch_student_ids = set()
+        for row in rows:
+            username = row.get('username', '')
+            password = row.get('password', '')
+            student_id = row.get('student_id') or None
+            try:
+                role = UserRole(row.get('role') or UserRole.STUDENT)
+            except ValueError:
+                results.append((False, f"Invalid role: {row.get('role')}."))
+                continue
+
+            error = self._validate_registration(username, password, role, student_id)
+            if not error and username in batch_usernames:
+                error = "Username already exists."
+            if not error and student_id and student_id in batch_student_ids:
+                error = f"Student ID {student_id} is already registered to another account."
+            if error:
+                results.append((False, error))
+                continue
+
+            batch_usernames.add(username)
+            if student_id:
+                batch_student_ids.add(student_id)
+            accepted.append((User(username, b"", role, student_id), password))
+            results.append((True, f"User {username} registered successfully."))
+
+        # scrypt is memory-hard, so the pool is sized by memory as well as CPUs
+        hash_memory = 128 * _SCRYPT_R * (1 << get_kdf_cost())
+        workers = min(os.cpu_count() or 1, len(accepted), BULK_HASH_MEMORY_BUDGET // hash_memory)
+        if len(accepted) >= BULK_HASH_MIN_ROWS and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda item: item[0].set_password(item[1]), accepted))
+        else:
+            for user, password in accepted:
+                user.set_password(password)
+
+        # Only fully hashed users become visible
+        for user, _ in accepted:
+            self.users[user.username] = user
+            if user.student_id:
+                self.student_id_index[user.student_id] = user.username
+
+        if accepted:
+            self._append_users([user for user, _ in accepted])
+        return results
+
+    def _validate_registration(self, username: str, password: str, role: UserRole,
+                               student_id: Optional[str]) -> Optional[str]:
+        """
+        Check a new account's details against the existing users.
+
+        Args:
+            username: Username
+            password: Plain text password
+            role: User role
+            student_id: Student ID (required for students)
+
+        Returns:
+            Error message, or None if the account can be created
+        """
         if not username or not password:
-            return False, "Username and password cannot be empty."
+            return "Username and password cannot be empty."
 
         if username in self.users:
-            return False, "Username already exists."
+            return "Username already exists."
 
         if role == UserRole.STUDENT and not student_id:
-            return False, "Student ID is required for student accounts."
+            return "Student ID is required for student accounts."
 
         if len(password) < 6:
-            return False, "Password must be at least 6 characters long."
+            return "Password must be at least 6 characters long."
 
         # Check if student ID is already taken
-        if student_id:
-            for existing_user in self.users.values():
-                if existing_user.student_id == student_id:
-                    return False, f"Student ID {student_id} is already registered to another account."
-
-        user = User(
-            username,
-            User._hash_password(password),
-            role,
-            student_id
-        )
-        self.users[username] = user
-        self.save_users()
+        if student_id and student_id in self.student_id_index:
+            return f"Student ID {student_id} is already registered to another account."
 
-        return True, f"User {username} registered successfully."
+        return None
 
     def change_password(self, username: str, old_password: str, new_password: str) -> Tuple[bool, str]:
         """
@@ -243,8 +665,9 @@ class AuthenticationSystem:
         if len(new_password) < 6:
             return False, "New password must be at least 6 characters long."
 
-        user.password_hash = User._hash_password(new_password)
-        self.save_users()
+        user.set_password(new_password)
+        self._verify_cache.pop(username, None)
+        self._log_password_change(user)
 
         return True, "Password changed successfully."
 
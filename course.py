@@ -4,14 +4,24 @@ Course class module for the University Course Registration System.
 CS 236: Data Structures and Algorithms - Final Lab Assignment #5
 
 This module contains the Course class that represents a course in the system.
-Uses a Set data structure for O(1) student enrollment lookups and automatic
-duplicate prevention.
+Keeps enrolled student IDs in a sorted list: binary search gives O(log n)
+lookups and duplicate prevention, and for class-sized rosters a compact list
+beats a Set on memory and cache locality.
 
 Author: Chinyemba
 Date: 10/24/2025
 """
 
-from typing import Set
+from array import array
+import sys
+from bisect import bisect_left
+from typing import List, Optional, Sequence, Set, Tuple
+
+# Bit position of each meeting day in Course._days_mask ("Th" is stored as R)
+DAY_BITS = {day: 1 << i for i, day in enumerate("MTWRFSU")}
+
+# Course._week_mask has one bit per minute of the week, day by day in DAY_BITS order
+MINUTES_PER_DAY = 24 * 60
 
 
 class Course:
@@ -22,14 +32,19 @@ class Course:
         course_id (str): Unique identifier for the course (e.g., "CS101")
         name (str): Name of the course (e.g., "Introduction to Programming")
         instructor (str): Name of the instructor teaching the course
-        enrolled_students (Set[str]): Set of student IDs enrolled in this course
-                                      Uses Set for O(1) membership testing
+        enrolled_students (List[str]): Sorted list of student IDs enrolled in this course
+                                       Uses binary search for membership testing
         max_students (int): Maximum capacity of the course (default: 30)
         days (str): Days the course meets (e.g., "MWF", "TTh")
         time (str): Time the course meets (e.g., "9:00-10:15")
         location (str): Building and room where course is held (e.g., "Engineering 201")
     """
 
+    # Fixed attribute set: no per-instance __dict__, smaller objects in large catalogs
+    __slots__ = ('course_id', 'name', 'instructor', '_enrolled', '_enrolled_raw', 'max_students',
+                 'days', 'time', 'location', '_days_mask', '_start_min', '_end_min',
+                 '_week_mask', '_day_keys', '_time_key', '_enrolled_csv', '_n_enrolled')
+
     def __init__(self, course_id: str, name: str, instructor: str, max_students: int = 30,
                  days: str = "", time: str = "", location: str = ""):
         """
@@ -44,15 +59,91 @@ class Course:
             time (str): Time the course meets (e.g., "9:00-10:15")
             location (str): Building and room where course is held (e.g., "Engineering 201")
         """
-        self.course_id = course_id
+        # Interned so every copy of a Course ID shares one string object
+        self.course_id = sys.intern(course_id)
         self.name = name
         self.instructor = instructor
-        # Use Set for O(1) lookups and automatic duplicate prevention
-        self.enrolled_students: Set[str] = set()
+        # Sorted list: binary-search lookups, no duplicates, small footprint.
+        # None while the roster is still the unparsed CSV field in _enrolled_raw.
+        self._enrolled: Optional[List[str]] = []
+        self._enrolled_raw = ""
+        # Roster size kept alongside the list for the capacity checks
+        self._n_enrolled = 0
+        # ';'-joined roster for saving, rebuilt only after the roster changes
+        self._enrolled_csv: Optional[str] = None
         self.max_students = max_students
         self.days = days
         self.time = time
         self.location = location
+        # Schedule parsed once here so conflict checks are plain integer math
+        self._parse_schedule()
+
+    def _parse_schedule(self) -> None:
+        """
+        Parse days and time into a day bitmask and start/end minutes.
+
+        Sets _days_mask (0 if no days) and _start_min/_end_min (-1 if the time
+        is missing or malformed, which never conflicts with anything), plus
+        _week_mask with a bit set for every minute of the week the course meets.
+        Also keeps _day_keys (e.g. ('T', 'Th')) and _time_key ((start, end)) for
+        the schedule formatter.
+        """
+        mask = 0
+        day_keys = []
+        i = 0
+        while i < len(self.days):
+            if self.days.startswith("Th", i):
+                mask |= DAY_BITS["R"]
+                day_keys.append("Th")
+                i += 2
+            else:
+                mask |= DAY_BITS.get(self.days[i], 0)
+                day_keys.append(self.days[i])
+                i += 1
+        self._days_mask = mask
+        self._day_keys = tuple(day_keys)
+
+        try:
+            self._start_min, self._end_min = self._parse_time_range(self.time)
+        except ValueError:
+            self._start_min = self._end_min = -1
+        self._time_key = (self._start_min, self._end_min)
+
+        week_mask = 0
+        if self._start_min < self._end_min:
+            minutes = (1 << (self._end_min - self._start_min)) - 1
+            for i, bit in enumerate(DAY_BITS.values()):
+                if mask & bit:
+                    week_mask |= minutes << (i * MINUTES_PER_DAY + self._start_min)
+        self._week_mask = week_mask
+
+    def load_roster_csv(self, enrolled: str) -> None:
+        """
+        Set the roster from its ';'-separated CSV field without parsing it yet.
+
+        The field is split into the sorted list the first time enrolled_students
+        is used; until then the count comes from the separators and saving
+        writes the field back unchanged.
+
+        Args:
+            enrolled: Student IDs joined with ';' (empty string if none)
+        """
+        self._enrolled = None
+        self._enrolled_raw = enrolled
+        self._n_enrolled = enrolled.count(';') + 1 if enrolled else 0
+        self._enrolled_csv = enrolled
+
+    @property
+    def enrolled_students(self) -> List[str]:
+        """Sorted list of enrolled student IDs, parsed from the CSV field on first use."""
+        if self._enrolled is None:
+            raw = self._enrolled_raw
+            self._enrolled = sorted(set(map(sys.intern, raw.split(';')))) if raw else []
+            self._enrolled_raw = ""
+            # Exact count once parsed (a hand-edited field may repeat an ID)
+            self._n_enrolled = len(self._enrolled)
+            self._enrolled_csv = None
+        return self._enrolled
 
     def add_student(self, student_id: str) -> bool:
         """
@@ -64,9 +155,16 @@ class Course:
         Returns:
             True if student was added, False if course is full
         """
-        if len(self.enrolled_students) >= self.max_students:
+        if self._n_enrolled >= self.max_students:
             return False
-        self.enrolled_students.add(student_id)
+        # Share one string object per Student ID across users and rosters
+        student_id = sys.intern(student_id)
+        roster = self.enrolled_students
+        i = bisect_left(roster, student_id)
+        if i == len(roster) or roster[i] != student_id:
+            roster.insert(i, student_id)
+            self._n_enrolled += 1
+            self._enrolled_csv = None
         return True
 
     def remove_student(self, student_id: str) -> None:
@@ -76,7 +174,12 @@ class Course:
         Args:
             student_id: ID of the student to remove
         """
-        self.enrolled_students.discard(student_id)
+        roster = self.enrolled_students
+        i = bisect_left(roster, student_id)
+        if i < len(roster) and roster[i] == student_id:
+            roster.pop(i)
+            self._n_enrolled -= 1
+            self._enrolled_csv = None
 
     def is_full(self) -> bool:
         """
@@ -85,7 +188,7 @@ class Course:
         Returns:
             True if course is full, False otherwise
         """
-        return len(self.enrolled_students) >= self.max_students
+        return self._n_enrolled >= self.max_students
 
     def get_available_seats(self) -> int:
         """
@@ -94,7 +197,7 @@ class Course:
         Returns:
             Number of available seats
         """
-        return self.max_students - len(self.enrolled_students)
+        return self.max_students - self._n_enrolled
 
     def get_enrollment_count(self) -> int:
         """
@@ -103,7 +206,7 @@ class Course:
         Returns:
             Number of enrolled students
         """
-        return len(self.enrolled_students)
+        return self._n_enrolled
 
     def is_student_enrolled(self, student_id: str) -> bool:
         """
@@ -115,7 +218,41 @@ class Course:
         Returns:
             True if enrolled, False otherwise
         """
-        return student_id in self.enrolled_students
+        roster = self.enrolled_students
+        i = bisect_left(roster, student_id)
+        return i < len(roster) and roster[i] == student_id
+
+    def get_enrolled_csv(self) -> str:
+        """
+        Get the enrolled student IDs as the ';'-separated string stored in courses.csv.
+
+        Returns:
+            Sorted student IDs joined with ';' (empty string if none)
+        """
+        if self._enrolled_csv is None:
+            self._enrolled_csv = ';'.join(self.enrolled_students)
+        return self._enrolled_csv
+
+    def get_day_bits(self) -> List[int]:
+        """
+        Get the single-day bits (from DAY_BITS) for each day the course meets.
+
+        Returns:
+            List of day bits, empty if the course has no schedule
+        """
+        return [bit for bit in DAY_BITS.values() if self._days_mask & bit]
+
+    def get_week_mask(self) -> int:
+        """
+        Get the course's meeting minutes as a bitmask over the whole week.
+
+        Two courses conflict exactly when their week masks share a bit, so a
+        student's courses can be OR'd into one mask and tested with a single AND.
+
+        Returns:
+            Week bitmask (0 if the course has no schedule)
+        """
+        return self._week_mask
 
     def has_schedule_conflict(self, other_course: 'Course') -> bool:
         """
@@ -127,52 +264,71 @@ class Course:
         Returns:
             True if there is a time conflict, False otherwise
         """
-        # If either course doesn't have schedule info, no conflict
-        if not self.days or not self.time or not other_course.days or not other_course.time:
-            return False
-
-        # Check if courses share any common days
-        if not self._has_common_days(other_course.days):
-            return False
-
-        # If they share days, check if times overlap
-        return self._times_overlap(self.time, other_course.time)
-
-    def _has_common_days(self, other_days: str) -> bool:
+        # Courses without schedule info have an empty day mask or -1 times,
+        # so they never conflict
+        return ((self._days_mask & other_course._days_mask) != 0
+                and self._start_min < other_course._end_min
+                and other_course._start_min < self._end_min)
+
+    @staticmethod
+    def schedule_arrays(courses: Sequence['Course']) -> Tuple[array, array, array]:
         """
-        Check if this course shares any days with another course.
+        Collect the precomputed schedule fields of many courses into flat arrays.
 
         Args:
-            other_days: Days string from another course (e.g., "MWF")
+            courses: Courses to collect
 
         Returns:
-            True if courses share at least one day
+            Tuple of (days_mask, start_min, end_min) int arrays, one entry per course
         """
-        self_days = set(self.days)
-        other_days_set = set(other_days)
-        return len(self_days.intersection(other_days_set)) > 0
+        return (array('i', [c._days_mask for c in courses]),
+                array('i', [c._start_min for c in courses]),
+                array('i', [c._end_min for c in courses]))
 
-    def _times_overlap(self, time1: str, time2: str) -> bool:
+    @staticmethod
+    def conflict_graph(courses: Sequence['Course']) -> List[Set[int]]:
         """
-        Check if two time ranges overlap.
+        Find every pairwise schedule conflict among a set of courses.
+
+        Courses whose start time is not before their end time (malformed or
+        unparsed times) are checked pair by pair, so every entry agrees with
+        has_schedule_conflict.
 
         Args:
-            time1: First time range (e.g., "9:00-10:15")
-            time2: Second time range (e.g., "10:30-11:45")
+            courses: Courses to compare
 
         Returns:
-            True if times overlap, False otherwise
+            One set per course holding the indices of the other courses it
+            conflicts with
         """
-        try:
-            # Parse time ranges
-            start1, end1 = self._parse_time_range(time1)
-            start2, end2 = self._parse_time_range(time2)
-
-            # Check if ranges overlap: start1 < end2 and start2 < end1
-            return start1 < end2 and start2 < end1
-        except:
-            # If parsing fails, assume no conflict
-            return False
+        days, starts, ends = Course.schedule_arrays(courses)
+        n = len(courses)
+        graph: List[Set[int]] = [set() for _ in range(n)]
+        scheduled = [i for i in range(n) if days[i]]
+
+        # Sweep courses in start-time order, keeping only those still in
+        # session; each course is compared against that short active list
+        # instead of every other course
+        order = sorted((i for i in scheduled if starts[i] < ends[i]), key=starts.__getitem__)
+        active: List[int] = []
+        for i in order:
+            start = starts[i]
+            active = [j for j in active if ends[j] > start]
+            for j in active:
+                if days[i] & days[j]:
+                    graph[i].add(j)
+                    graph[j].add(i)
+            active.append(i)
+
+        # Start-ordering doesn't hold for inverted ranges; there are rarely any
+        for i in scheduled:
+            if starts[i] >= ends[i]:
+                for j in scheduled:
+                    if (j != i and days[i] & days[j]
+                            and starts[i] < ends[j] and starts[j] < ends[i]):
+                        graph[i].add(j)
+                        graph[j].add(i)
+        return graph
 
     def _parse_time_range(self, time_range: str) -> tuple:
         """
@@ -206,9 +362,9 @@ class Course:
         """String representation of the course."""
         return (f"Course ID: {self.course_id}, Name: {self.name}, "
                 f"Instructor: {self.instructor}, "
-                f"Enrolled: {len(self.enrolled_students)}/{self.max_students}")
+                f"Enrolled: {self._n_enrolled}/{self.max_students}")
 
     def __repr__(self) -> str:
         """Developer-friendly representation of the course."""
         return (f"Course(course_id='{self.course_id}', name='{self.name}', "
-                f"instructor='{self.instructor}', enrolled={len(self.enrolled_students)}/{self.max_students})")
+                f"instructor='{self.instructor}', enrolled={self._n_enrolled}/{self.max_students})")
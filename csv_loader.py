@@ -0,0 +1,108 @@
+"""
+CSV loading helpers for the University Course Registration System.
+
+CS 236: Data Structures and Algorithms - Final Lab Assignment #5
+
+This module reads the system's CSV data files into a header and a list of rows.
+Small files are parsed serially with csv.reader. Large files are memory-mapped
+and split into byte ranges on line boundaries, and each range is parsed in a
+separate worker process so parsing isn't limited by the GIL.
+
+Rows are assumed not to contain embedded newlines, which holds for every file
+the system writes (all fields come from single-line inputs).
+
+Author: Jonathan
+Date: 10/24/2025
+"""
+
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+# Buffer size for bulk CSV reads and writes (the default is ~8 KiB)
+IO_BUFFER_SIZE = 1 << 20
+
+# Files at least this large are parsed in parallel segments
+PARALLEL_MIN_BYTES = 1 << 20
+
+
+def read_rows(path: str) -> Tuple[List[str], List[List[str]]]:
+    """
+    Read a CSV file into its header row and data rows.
+
+    Args:
+        path: Path to the CSV file
+
+    Returns:
+        Tuple of (header, rows); header is empty if the file is empty
+    """
+    if os.path.getsize(path) >= PARALLEL_MIN_BYTES:
+        try:
+            return _read_rows_parallel(path)
+        except Exception as e:
+            print(f"Parallel load of {path} failed, reading serially: {e}")
+
+    with open(path, 'r', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        return header, list(reader)
+
+
+def _read_rows_parallel(path: str) -> Tuple[List[str], List[List[str]]]:
+    """
+    Parse a large CSV file by splitting it into per-worker byte ranges.
+
+    Args:
+        path: Path to the CSV file
+
+    Returns:
+        Tuple of (header, rows)
+    """
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            header_end = mm.find(b'\n')
+            if header_end == -1:
+                return next(csv.reader([mm[:].decode('utf-8')]), []), []
+            header = next(csv.reader([mm[:header_end + 1].decode('utf-8')]))
+
+            # Cut the data into roughly equal ranges, each ending just past a newline
+            workers = os.cpu_count() or 1
+            data_start = header_end + 1
+            step = max(1, (size - data_start) // workers)
+            bounds = [data_start]
+            for i in range(1, workers):
+                newline = mm.find(b'\n', data_start + i * step)
+                if newline == -1:
+                    break
+                if newline + 1 > bounds[-1]:
+                    bounds.append(newline + 1)
+            bounds.append(size)
+
+    ranges = [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+    rows: List[List[str]] = []
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        for part in executor.map(_parse_segment, [path] * len(ranges), *zip(*ranges)):
+            rows.extend(part)
+    return header, rows
+
+
+def _parse_segment(path: str, start: int, end: int) -> List[List[str]]:
+    """
+    Parse the CSV rows in one byte range of a file (runs in a worker process).
+
+    Args:
+        path: Path to the CSV file
+        start: Offset of the first byte of the range (start of a line)
+        end: Offset just past the last byte of the range (end of a line)
+
+    Returns:
+        List of parsed rows
+    """
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = mm[start:end].decode('utf-8')
+    return list(csv.reader(io.StringIO(text, newline='')))
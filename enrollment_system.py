@@ -6,6 +6,15 @@ CS 236: Data Structures and Algorithms - Final Lab Assignment #5
 This module contains the EnrollmentSystem class that manages student-course
 registrations and maintains records with CSV file persistence.
 
+Changes are not written on every mutation: registrations, enrollments and drops
+are appended to the enrollments.csv journal as they happen, and
+students.csv/courses.csv are rewritten by flush() (after a batch of changes, on
+close(), and at interpreter exit). load_data() replays the journal, and each
+save of students.csv empties it.
+
+The CSVs stay the source of truth. flush() also writes a JSON snapshot, which
+load_data() reads instead of parsing CSV when no CSV has changed since.
+
 Uses Dictionary data structures for O(1) lookups of students and courses by ID.
 Implements file I/O with CSV format for data persistence.
 
@@ -13,11 +22,50 @@ Author: Chinyemba
 Date: 10/24/2025
 """
 
+import atexit
 import csv
 import os
-from typing import Dict, Tuple
+from contextlib import contextmanager
+import json
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
 from student import Student
 from course import Course
+from csv_loader import IO_BUFFER_SIZE, read_rows
+
+# Unsaved changes allowed before students.csv/courses.csv are rewritten automatically
+AUTO_FLUSH_MUTATIONS = 50
+
+# Column order of courses.csv and students.csv
+COURSES_FIELDNAMES = ['course_id', 'name', 'instructor', 'max_students', 'enrolled_students',
+                      'days', 'time', 'location']
+STUDENTS_FIELDNAMES = ['student_id', 'name', 'registered_courses']
+
+# enrollments.csv columns: one row per enroll/drop operation. REGISTER rows
+# record a new student, with the student's name in the course_id column.
+ENROLLMENTS_FIELDNAMES = ['student_id', 'course_id', 'op']
+ENROLL = 'ENROLL'
+DROP = 'DROP'
+REGISTER = 'REGISTER'
+
+# JSON copy of students/courses, preferred at startup while it is newer than the CSVs
+# (plain data only, so a tampered file cannot run code the way a pickle could)
+SNAPSHOT_FILE = 'enrollment_state.json'
+SNAPSHOT_VERSION = 3
+
+# Days shown on the printable schedule, in order (keys match Course._day_keys)
+SCHEDULE_DAYS = ('M', 'T', 'W', 'Th', 'F')
+
+# Separator lines for the text views, built once rather than on every call
+RULE_80 = "=" * 80 + "\n"
+DASH_80 = "-" * 80 + "\n"
+BOX_BOTTOM = "└" + "─" * 78 + "┘\n\n"
+
+# One view_available_courses block per course, separator included
+AVAILABLE_HEADER = "Available Courses:\n" + RULE_80
+COURSE_LISTING = ("{0}: {1}\n"
+                  "  Instructor: {2}\n"
+                  "  Capacity: {3}/{4} ({5})\n" + DASH_80)
 
 
 class EnrollmentSystem:
@@ -30,6 +78,8 @@ class EnrollmentSystem:
                                        Uses Dict for O(1) student lookup
         courses (Dict[str, Course]): Dictionary mapping course IDs to Course objects
                                      Uses Dict for O(1) course lookup
+        _by_day (Dict[int, List[Course]]): Courses bucketed by each day bit they meet on,
+                                           so conflict searches skip other days entirely
     """
 
     def __init__(self, data_directory: str = "."):
@@ -43,8 +93,23 @@ class EnrollmentSystem:
         # Use Dictionaries for O(1) lookups by ID
         self.students: Dict[str, Student] = {}
         self.courses: Dict[str, Course] = {}
+        self._by_day: Dict[int, List[Course]] = {}
+        # Unsaved-change tracking for flush()
+        # IDs of records changed since the last save; a file is only rewritten
+        # by flush() if one of its records is in the matching set
+        self._dirty_students: Set[str] = set()
+        self._dirty_courses: Set[str] = set()
+        self._pending_mutations = 0
+        # Nesting depth of bulk_mutations() blocks; auto-flush is off while > 0
+        self._bulk_depth = 0
+        # Data files stay open once first written: full rewrites seek to the start
+        # and truncate, and journal rows are appended through the same handle
+        self._files: Dict[str, TextIO] = {}
+        self._enrollments_writer = None
         # Load existing data from CSV files
         self.load_data()
+        # Make sure batched changes reach disk when the program exits
+        atexit.register(self.close)
 
     def _get_file_path(self, filename: str) -> str:
         """
@@ -61,31 +126,46 @@ class EnrollmentSystem:
     def load_data(self) -> None:
         """
         Load student and course data from CSV files into memory.
-        Reads courses.csv and students.csv from the data directory.
+        Reads courses.csv and students.csv from the data directory, or the
+        snapshot if it is newer than all of them.
         """
-        # Load courses from CSV file
+        if self._load_snapshot():
+            return
+
+        # Load courses from CSV file (large files are parsed in parallel segments)
         courses_file = self._get_file_path('courses.csv')
         if os.path.exists(courses_file):
             try:
-                with open(courses_file, 'r', newline='', encoding='utf-8') as file:
-                    reader = csv.DictReader(file)
-                    for row in reader:
-                        # Create Course object from CSV row
-                        course = Course(
-                            row['course_id'],
-                            row['name'],
-                            row['instructor'],
-                            int(row.get('max_students', 30)),
-                            row.get('days', ''),
-                            row.get('time', ''),
-                            row.get('location', '')
-                        )
-                        # Parse enrolled students (semicolon-separated list)
-                        enrolled = row.get('enrolled_students', '')
-                        if enrolled:
-                            course.enrolled_students = set(enrolled.split(';'))
-                        # Store in dictionary for O(1) lookup
-                        self.courses[course.course_id] = course
+                header, rows = read_rows(courses_file)
+                # Resolve column positions once; schedule columns are absent in older files
+                idx = {name: i for i, name in enumerate(header)}
+                if header:
+                    id_i = idx['course_id']
+                    name_i = idx['name']
+                    instructor_i = idx['instructor']
+                max_i = idx.get('max_students')
+                enrolled_i = idx.get('enrolled_students')
+                days_i = idx.get('days')
+                time_i = idx.get('time')
+                location_i = idx.get('location')
+                for row in rows:
+                    # Create Course object from CSV row
+                    course = Course(
+                        row[id_i],
+                        row[name_i],
+                        row[instructor_i],
+                        int(row[max_i]) if max_i is not None else 30,
+                        row[days_i] if days_i is not None else '',
+                        row[time_i] if time_i is not None else '',
+                        row[location_i] if location_i is not None else ''
+                    )
+                    # Keep the semicolon-separated roster as-is; it is parsed on first use
+                    enrolled = row[enrolled_i] if enrolled_i is not None else ''
+                    if enrolled:
+                        course.load_roster_csv(enrolled)
+                    # Store in dictionary for O(1) lookup
+                    self.courses[course.course_id] = course
+                    self._index_course(course)
             except Exception as e:
                 print(f"Error loading courses: {e}")
 
@@ -93,73 +173,332 @@ class EnrollmentSystem:
         students_file = self._get_file_path('students.csv')
         if os.path.exists(students_file):
             try:
-                with open(students_file, 'r', newline='', encoding='utf-8') as file:
-                    reader = csv.DictReader(file)
-                    for row in reader:
-                        student = Student(row['student_id'], row['name'])
-                        # Load registered courses
-                        courses = row.get('registered_courses', '')
-                        if courses:
-                            student.registered_courses = set(courses.split(';'))
-                        self.students[student.student_id] = student
+                header, rows = read_rows(students_file)
+                idx = {name: i for i, name in enumerate(header)}
+                if header:
+                    id_i = idx['student_id']
+                    name_i = idx['name']
+                courses_i = idx.get('registered_courses')
+                for row in rows:
+                    student = Student(row[id_i], row[name_i])
+                    # Load registered courses
+                    courses = row[courses_i] if courses_i is not None else ''
+                    if courses:
+                        student.registered_courses = set(map(sys.intern, courses.split(';')))
+                    self.students[student.student_id] = student
             except Exception as e:
                 print(f"Error loading students: {e}")
 
+        self._replay_enrollments()
+
+    def _load_snapshot(self) -> bool:
+        """
+        Load students and courses from the JSON snapshot if it is up to date.
+
+        Returns:
+            True if the snapshot was loaded, False if the CSVs must be read
+        """
+        snapshot_file = self._get_file_path(SNAPSHOT_FILE)
+        if not os.path.exists(snapshot_file):
+            return False
+        # Any CSV written at or after the snapshot (including journal appends) wins
+        snapshot_mtime = os.stat(snapshot_file).st_mtime_ns
+        for filename in ('courses.csv', 'students.csv', 'enrollments.csv'):
+            path = self._get_file_path(filename)
+            if os.path.exists(path) and os.stat(path).st_mtime_ns >= snapshot_mtime:
+                return False
+
+        try:
+            with open(snapshot_file, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+                state = json.load(file)
+            if state.get('version') != SNAPSHOT_VERSION:
+                return False
+            for course_id, name, instructor, max_students, days, time, location, enrolled in state['courses']:
+                course = Course(course_id, name, instructor, max_students, days, time, location)
+                if enrolled:
+                    course.load_roster_csv(enrolled)
+                self.courses[course.course_id] = course
+                self._index_course(course)
+            for student_id, name, registered in state['students']:
+                student = Student(student_id, name)
+                if registered:
+                    student.registered_courses = set(map(sys.intern, registered))
+                self.students[student.student_id] = student
+            return True
+        except Exception as e:
+            print(f"Error loading snapshot: {e}")
+            self.students.clear()
+            self.courses.clear()
+            self._by_day.clear()
+            return False
+
+    def save_snapshot(self) -> None:
+        """Write the JSON snapshot of students and courses used for fast startup."""
+        snapshot_file = self._get_file_path(SNAPSHOT_FILE)
+        state = {
+            'version': SNAPSHOT_VERSION,
+            'courses': [(c.course_id, c.name, c.instructor, c.max_students,
+                         c.days, c.time, c.location, c.get_enrolled_csv())
+                        for c in self.courses.values()],
+            'students': [(s.student_id, s.name, list(s.registered_courses))
+                         for s in self.students.values()],
+        }
+        try:
+            # Write to a temporary file first so a crash never leaves a partial snapshot
+            temp_file = snapshot_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+                json.dump(state, file, separators=(',', ':'))
+            os.replace(temp_file, snapshot_file)
+        except Exception as e:
+            print(f"Error saving snapshot: {e}")
+
+    def _replay_enrollments(self) -> None:
+        """
+        Apply the enrollments journal on top of the loaded students and courses.
+
+        Recovers registrations, enrollments and drops made after the last save.
+        Files in the old two-column format are a snapshot rather than a journal and
+        are skipped.
+        """
+        enrollments_file = self._get_file_path('enrollments.csv')
+        if not os.path.exists(enrollments_file):
+            return
+        try:
+            with open(enrollments_file, 'r', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
+                reader = csv.reader(file)
+                if next(reader, None) != ENROLLMENTS_FIELDNAMES:
+                    return
+                for student_id, course_id, op in reader:
+                    if op == REGISTER:
+                        # Registered after the last save; later rows may enroll them
+                        if student_id not in self.students:
+                            student = Student(student_id, course_id)
+                            self.students[student.student_id] = student
+                            # Marked directly: _mark_dirty could flush and truncate
+                            # the journal while it is being read
+                            self._dirty_students.add(student.student_id)
+                        continue
+                    student = self.students.get(student_id)
+                    course = self.courses.get(course_id)
+                    if student is None or course is None:
+                        continue
+                    # Ops are applied in order, so the last one for each pair wins
+                    if op == ENROLL:
+                        # A course whose cap was lowered since may have no seat left;
+                        # the student only gets the course if the roster takes them
+                        if student_id not in course.enrolled_students and not course.add_student(student_id):
+                            print(f"Skipping journaled enrollment of {student_id} in {course_id}: course is full")
+                            continue
+                        student.add_course(course_id)
+                    elif op == DROP:
+                        student.remove_course(course_id)
+                        course.remove_student(student_id)
+                    # Persisted by the next flush, which then empties the journal
+                    self._dirty_students.add(student_id)
+                    self._dirty_courses.add(course_id)
+        except Exception as e:
+            print(f"Error loading enrollments: {e}")
+
     def save_data(self) -> None:
         """Save student and course data to CSV files."""
-        # Save courses
-        courses_file = self._get_file_path('courses.csv')
+        self._save_courses()
+        self._save_students()
+        # Everything in the journal is now in the CSVs
+        self.compact_enrollments()
+
+        self._dirty_students.clear()
+        self._dirty_courses.clear()
+        self._pending_mutations = 0
+
+    def _save_courses(self) -> None:
+        """Rewrite courses.csv from the in-memory courses."""
         try:
-            with open(courses_file, 'w', newline='', encoding='utf-8') as file:
-                fieldnames = ['course_id', 'name', 'instructor', 'max_students', 'enrolled_students', 'days', 'time', 'location']
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                for course in self.courses.values():
-                    writer.writerow({
-                        'course_id': course.course_id,
-                        'name': course.name,
-                        'instructor': course.instructor,
-                        'max_students': course.max_students,
-                        'enrolled_students': ';'.join(course.enrolled_students),
-                        'days': course.days,
-                        'time': course.time,
-                        'location': course.location
-                    })
+            file = self._rewrite_file('courses.csv')
+            writer = csv.writer(file)
+            # Rows written positionally in COURSES_FIELDNAMES order; writerows
+            # runs the per-row loop in C
+            writer.writerow(COURSES_FIELDNAMES)
+            writer.writerows(
+                (course.course_id, course.name, course.instructor, course.max_students,
+                 course.get_enrolled_csv(), course.days, course.time, course.location)
+                for course in self.courses.values()
+            )
+            file.flush()
         except Exception as e:
             print(f"Error saving courses: {e}")
 
-        # Save students
-        students_file = self._get_file_path('students.csv')
+    def _save_students(self) -> None:
+        """Rewrite students.csv from the in-memory students."""
         try:
-            with open(students_file, 'w', newline='', encoding='utf-8') as file:
-                fieldnames = ['student_id', 'name', 'registered_courses']
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                for student in self.students.values():
-                    writer.writerow({
-                        'student_id': student.student_id,
-                        'name': student.name,
-                        'registered_courses': ';'.join(student.registered_courses)
-                    })
+            file = self._rewrite_file('students.csv')
+            writer = csv.writer(file)
+            writer.writerow(STUDENTS_FIELDNAMES)
+            writer.writerows(
+                (student.student_id, student.name, student.get_registered_csv())
+                for student in self.students.values()
+            )
+            file.flush()
         except Exception as e:
             print(f"Error saving students: {e}")
 
-        # Save enrollments
-        enrollments_file = self._get_file_path('enrollments.csv')
+    def compact_enrollments(self) -> None:
+        """
+        Empty the enrollments journal down to its header.
+
+        Called right after students.csv and courses.csv are saved, so only
+        operations made after that save are replayed on the next load.
+        """
+        self._enrollments_writer = None
         try:
-            with open(enrollments_file, 'w', newline='', encoding='utf-8') as file:
-                fieldnames = ['student_id', 'course_id']
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                for student in self.students.values():
-                    for course_id in student.registered_courses:
-                        writer.writerow({
-                            'student_id': student.student_id,
-                            'course_id': course_id
-                        })
+            file = self._rewrite_file('enrollments.csv')
+            writer = csv.writer(file)
+            writer.writerow(ENROLLMENTS_FIELDNAMES)
+            file.flush()
+            # Later enroll/drop rows are appended after the header
+            self._enrollments_writer = writer
         except Exception as e:
             print(f"Error saving enrollments: {e}")
 
+    def _open_file(self, filename: str) -> TextIO:
+        """
+        Get the long-lived handle for a data file, opening it on first use.
+
+        Args:
+            filename: Name of the file in the data directory
+
+        Returns:
+            Text handle in append mode (writes go to the current end of file)
+        """
+        file = self._files.get(filename)
+        if file is None:
+            file = open(self._get_file_path(filename), 'a+', newline='', encoding='utf-8',
+                        buffering=IO_BUFFER_SIZE)
+            self._files[filename] = file
+        return file
+
+    def _rewrite_file(self, filename: str) -> TextIO:
+        """
+        Get the handle for a data file emptied for a full rewrite.
+
+        Args:
+            filename: Name of the file in the data directory
+
+        Returns:
+            Text handle positioned at the start of the now-empty file
+        """
+        file = self._open_file(filename)
+        file.seek(0)
+        file.truncate()
+        return file
+
+    def flush(self) -> None:
+        """
+        Write out unsaved changes, rewriting only the files whose records changed.
+
+        courses.csv is rewritten if any course changed, and students.csv if any
+        student did (every journaled operation changes a student), after which the
+        journal is emptied.
+        """
+        if not self._dirty_students and not self._dirty_courses:
+            self._flush_journal()
+            return
+
+        if self._dirty_courses:
+            self._save_courses()
+        if self._dirty_students:
+            self._save_students()
+            self.compact_enrollments()
+        else:
+            self._flush_journal()
+        self._dirty_students.clear()
+        self._dirty_courses.clear()
+        self._pending_mutations = 0
+        self.save_snapshot()
+
+    def close(self) -> None:
+        """Flush unsaved changes and close the data files."""
+        self.flush()
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
+        self._enrollments_writer = None
+
+    def _mark_dirty(self, student_id: Optional[str] = None, course_id: Optional[str] = None) -> None:
+        """
+        Record an unsaved change, flushing once enough have accumulated.
+
+        Args:
+            student_id: ID of the student record that changed, if any
+            course_id: ID of the course record that changed, if any
+        """
+        if student_id is not None:
+            self._dirty_students.add(student_id)
+        if course_id is not None:
+            self._dirty_courses.add(course_id)
+        self._pending_mutations += 1
+        if self._pending_mutations >= AUTO_FLUSH_MUTATIONS and self._bulk_depth == 0:
+            self.flush()
+
+    @contextmanager
+    def bulk_mutations(self) -> Iterator[None]:
+        """
+        Suspend automatic flushing for a batch of changes, flushing once at the end.
+
+        Use as ``with system.bulk_mutations(): ...`` around bulk imports. Blocks may
+        be nested; only leaving the outermost one flushes.
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                self.flush()
+
+    def _log_enrollment(self, student_id: str, course_id: str, op: str) -> None:
+        """
+        Append one enroll/drop (or student registration) to the enrollments journal.
+
+        Args:
+            student_id: ID of the student
+            course_id: ID of the course (the student's name for REGISTER)
+            op: ENROLL, DROP or REGISTER
+        """
+        try:
+            if self._enrollments_writer is None:
+                if self._has_journal_header(self._get_file_path('enrollments.csv')):
+                    self._enrollments_writer = csv.writer(self._open_file('enrollments.csv'))
+                else:
+                    # Missing or old-format file: start the journal from a full snapshot
+                    self.save_data()
+            self._enrollments_writer.writerow((student_id, course_id, op))
+            # Pushed out per row so a crash loses at most the operation in progress
+            self._flush_journal()
+        except Exception as e:
+            print(f"Error saving enrollment: {e}")
+
+    def _flush_journal(self) -> None:
+        """Push buffered journal rows to disk if the journal is open."""
+        file = self._files.get('enrollments.csv')
+        if file is not None:
+            file.flush()
+
+    @staticmethod
+    def _has_journal_header(path: str) -> bool:
+        """
+        Check if a file exists and starts with the current enrollments header.
+
+        Args:
+            path: Path to enrollments.csv
+
+        Returns:
+            True if rows can be appended to the file as-is
+        """
+        if not os.path.exists(path):
+            return False
+        with open(path, 'r', newline='', encoding='utf-8') as file:
+            return next(csv.reader(file), None) == ENROLLMENTS_FIELDNAMES
+
     def register_student(self, student_id: str, name: str) -> Tuple[bool, str]:
         """
         Register a new student in the system.
@@ -177,8 +516,11 @@ class EnrollmentSystem:
         if student_id in self.students:
             return False, f"Student ID {student_id} already exists."
 
-        self.students[student_id] = Student(student_id, name)
-        self.save_data()
+        student = Student(student_id, name)
+        self.students[student.student_id] = student
+        # Journaled so the student's enrollments can be replayed after a crash
+        self._log_enrollment(student.student_id, name, REGISTER)
+        self._mark_dirty(student_id=student.student_id)
         return True, f"Student {name} registered successfully with ID {student_id}."
 
     def add_course(self, course_id: str, name: str, instructor: str, max_students: int = 30) -> Tuple[bool, str]:
@@ -207,10 +549,74 @@ class EnrollmentSystem:
         except ValueError:
             return False, "Maximum students must be a valid number."
 
-        self.courses[course_id] = Course(course_id, name, instructor, max_students)
-        self.save_data()
+        course = Course(course_id, name, instructor, max_students)
+        self.courses[course.course_id] = course
+        self._index_course(course)
+        self._mark_dirty(course_id=course.course_id)
         return True, f"Course {name} added successfully with ID {course_id}."
 
+    def add_courses(self, courses: Iterable[Tuple]) -> List[Tuple[bool, str]]:
+        """
+        Add many courses at once, writing them to disk in a single flush.
+
+        Args:
+            courses: Argument tuples for add_course, e.g.
+                     (course_id, name, instructor, max_students)
+
+        Returns:
+            One (success: bool, message: str) tuple per course, in order
+        """
+        with self.bulk_mutations():
+            return [self.add_course(*fields) for fields in courses]
+
+    def _index_course(self, course: Course) -> None:
+        """
+        Add a course to the per-day buckets used by find_conflicts.
+
+        Args:
+            course: Course to index
+        """
+        for bit in course.get_day_bits():
+            self._by_day.setdefault(bit, []).append(course)
+
+    def find_conflicts(self, course: Course) -> List[Course]:
+        """
+        Find every course whose schedule conflicts with the given course.
+
+        Only courses sharing at least one meeting day are examined.
+
+        Args:
+            course: Course to check
+
+        Returns:
+            List of conflicting courses (excluding the course itself)
+        """
+        candidates = {}
+        for bit in course.get_day_bits():
+            for other in self._by_day.get(bit, ()):
+                candidates[other.course_id] = other
+        candidates.pop(course.course_id, None)
+        return [other for other in candidates.values() if course.has_schedule_conflict(other)]
+
+    def _get_busy_mask(self, student: Student) -> int:
+        """
+        Get the OR of the week masks of a student's courses, rebuilding it if stale.
+
+        Args:
+            student: Student to check
+
+        Returns:
+            Bitmask of every minute of the week the student is in class
+        """
+        if student._busy_mask is None:
+            busy = 0
+            for course_id in student.registered_courses:
+                course = self.courses.get(course_id)
+                if course is not None:
+                    busy |= course.get_week_mask()
+            student._busy_mask = busy
+        return student._busy_mask
+
     def enroll_student(self, student_id: str, course_id: str) -> Tuple[bool, str]:
         """
         Enroll a student in a course.
@@ -222,16 +628,19 @@ class EnrollmentSystem:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        # Validate student exists
-        if student_id not in self.students:
-            return False, f"Student ID {student_id} not found."
+        # Interned IDs match stored keys by identity in the dict/set lookups below
+        student_id = sys.intern(student_id)
+        course_id = sys.intern(course_id)
 
-        # Validate course exists
-        if course_id not in self.courses:
-            return False, f"Course ID {course_id} not found."
+        courses = self.courses
 
-        student = self.students[student_id]
-        course = self.courses[course_id]
+        # Validate student and course exist (one dict lookup each)
+        student = self.students.get(student_id)
+        if student is None:
+            return False, f"Student ID {student_id} not found."
+        course = courses.get(course_id)
+        if course is None:
+            return False, f"Course ID {course_id} not found."
 
         # Check if already enrolled
         if course_id in student.registered_courses:
@@ -241,19 +650,21 @@ class EnrollmentSystem:
         if course.is_full():
             return False, f"Course {course.name} is full. No seats available."
 
-        # Check for schedule conflicts with enrolled courses
-        for enrolled_course_id in student.registered_courses:
-            if enrolled_course_id in self.courses:
-                enrolled_course = self.courses[enrolled_course_id]
-                if course.has_schedule_conflict(enrolled_course):
-                    return False, (f"⚠️ SCHEDULE CONFLICT: {course.name} ({course.days} {course.time}) "
-                                   f"conflicts with {enrolled_course.name} ({enrolled_course.days} {enrolled_course.time}). "
-                                   f"You cannot register for courses that meet at the same time.")
+        # Check for schedule conflicts: one AND against every minute the student
+        # is already busy; the conflicting course is only looked up on a hit
+        week_mask = course.get_week_mask()
+        if self._get_busy_mask(student) & week_mask:
+            enrolled_course = next(c for c in map(courses.get, student.registered_courses)
+                                   if c is not None and c.get_week_mask() & week_mask)
+            return False, (f"⚠️ SCHEDULE CONFLICT: {course.name} ({course.days} {course.time}) "
+                           f"conflicts with {enrolled_course.name} ({enrolled_course.days} {enrolled_course.time}). "
+                           f"You cannot register for courses that meet at the same time.")
 
         # Enroll the student
-        student.add_course(course_id)
+        student.add_course(course_id, week_mask)
         course.add_student(student_id)
-        self.save_data()
+        self._log_enrollment(student_id, course_id, ENROLL)
+        self._mark_dirty(student_id, course_id)
 
         return True, f"Student {student.name} successfully enrolled in {course.name}."
 
@@ -268,6 +679,10 @@ class EnrollmentSystem:
         Returns:
             Tuple of (success: bool, message: str)
         """
+        # Interned IDs match stored keys by identity in the dict/set lookups below
+        student_id = sys.intern(student_id)
+        course_id = sys.intern(course_id)
+
         # Validate student exists
         if student_id not in self.students:
             return False, f"Student ID {student_id} not found."
@@ -286,7 +701,8 @@ class EnrollmentSystem:
         # Drop the course
         student.remove_course(course_id)
         course.remove_student(student_id)
-        self.save_data()
+        self._log_enrollment(student_id, course_id, DROP)
+        self._mark_dirty(student_id, course_id)
 
         return True, f"Student {student.name} successfully dropped {course.name}."
 
@@ -300,15 +716,16 @@ class EnrollmentSystem:
         if not self.courses:
             return "No courses available."
 
-        result = "Available Courses:\n" + "="*80 + "\n"
+        # Collect pieces and join once instead of re-copying a growing string
+        parts = [AVAILABLE_HEADER]
+        append = parts.append
         for course in self.courses.values():
-            available = course.get_available_seats()
-            status = "FULL" if course.is_full() else f"{available} seats available"
-            result += f"{course.course_id}: {course.name}\n"
-            result += f"  Instructor: {course.instructor}\n"
-            result += f"  Capacity: {len(course.enrolled_students)}/{course.max_students} ({status})\n"
-            result += "-"*80 + "\n"
-        return result
+            enrolled = course.get_enrollment_count()
+            available = course.max_students - enrolled
+            status = "FULL" if available <= 0 else f"{available} seats available"
+            append(COURSE_LISTING.format(course.course_id, course.name, course.instructor,
+                                         enrolled, course.max_students, status))
+        return ''.join(parts)
 
     def view_student_courses(self, student_id: str) -> Tuple[bool, str]:
         """
@@ -328,15 +745,15 @@ class EnrollmentSystem:
         if not student.registered_courses:
             return True, f"Student {student.name} is not enrolled in any courses."
 
-        result = f"Courses for {student.name} (ID: {student_id}):\n" + "="*80 + "\n"
+        parts = [f"Courses for {student.name} (ID: {student_id}):\n", RULE_80]
         for course_id in student.registered_courses:
             if course_id in self.courses:
                 course = self.courses[course_id]
-                result += f"{course.course_id}: {course.name}\n"
-                result += f"  Instructor: {course.instructor}\n"
-                result += "-"*80 + "\n"
+                parts.append(f"{course.course_id}: {course.name}\n"
+                             f"  Instructor: {course.instructor}\n")
+                parts.append(DASH_80)
 
-        return True, result
+        return True, ''.join(parts)
 
     def get_all_students(self) -> Dict[str, Student]:
         """
@@ -380,6 +797,34 @@ class EnrollmentSystem:
         """
         return self.courses.get(course_id)
 
+    def _get_weekly_schedule(self, student: Student) -> Tuple[int, Dict[str, List[Course]]]:
+        """
+        Get a student's scheduled courses bucketed by day, rebuilding them if stale.
+
+        Args:
+            student: Student whose schedule to build
+
+        Returns:
+            Tuple of (number of courses with schedule info, day key -> courses
+            sorted by start and end time)
+        """
+        if student._weekly_schedule is None:
+            schedule_by_day: Dict[str, List[Course]] = {day: [] for day in SCHEDULE_DAYS}
+            count = 0
+            for course_id in student.registered_courses:
+                course = self.courses.get(course_id)
+                if course is None or not (course.days and course.time):
+                    continue
+                count += 1
+                for day in course._day_keys:
+                    if day in schedule_by_day:
+                        schedule_by_day[day].append(course)
+            # Integer sort on (start, end) minutes, done once per change rather than per render
+            for courses in schedule_by_day.values():
+                courses.sort(key=lambda c: c._time_key)
+            student._weekly_schedule = (count, schedule_by_day)
+        return student._weekly_schedule
+
     def get_formatted_schedule(self, student_id: str) -> str:
         """
         Generate a formatted printable schedule for a student.
@@ -398,15 +843,8 @@ class EnrollmentSystem:
         if not student.registered_courses:
             return "No courses enrolled."
 
-        # Collect courses with schedule info
-        scheduled_courses = []
-        for course_id in student.registered_courses:
-            if course_id in self.courses:
-                course = self.courses[course_id]
-                if course.days and course.time:
-                    scheduled_courses.append(course)
-
-        if not scheduled_courses:
+        scheduled_count, schedule_by_day = self._get_weekly_schedule(student)
+        if not scheduled_count:
             return "No courses with schedule information."
 
         # Create header
@@ -417,7 +855,7 @@ class EnrollmentSystem:
 
 Student: {student.name}
 Student ID: {student_id}
-Total Courses: {len(scheduled_courses)}
+Total Courses: {scheduled_count}
 
 """
 
@@ -430,41 +868,24 @@ Total Courses: {len(scheduled_courses)}
             'F': 'Friday'
         }
 
-        # Build weekly schedule
-        schedule_by_day = {'M': [], 'T': [], 'W': [], 'Th': [], 'F': []}
-
-        for course in scheduled_courses:
-            days = course.days
-            # Parse days string (e.g., "MWF" or "TTh")
-            if 'Th' in days:
-                schedule_by_day['Th'].append(course)
-                days = days.replace('Th', '')
-            for day in days:
-                if day in schedule_by_day:
-                    schedule_by_day[day].append(course)
-
         # Format weekly schedule
-        body = "=" * 80 + "\n"
-        body += "                             WEEKLY SCHEDULE\n"
-        body += "=" * 80 + "\n\n"
+        parts = [header, RULE_80, "                             WEEKLY SCHEDULE\n", RULE_80, "\n"]
 
-        day_order = ['M', 'T', 'W', 'Th', 'F']
-        for day_abbr in day_order:
+        for day_abbr in SCHEDULE_DAYS:
             day_name = day_map.get(day_abbr, day_abbr)
             courses = schedule_by_day[day_abbr]
 
-            body += f"┌─ {day_name} " + "─" * (74 - len(day_name)) + "┐\n"
+            parts.append(f"┌─ {day_name} " + "─" * (74 - len(day_name)) + "┐\n")
 
             if courses:
-                # Sort by time
-                sorted_courses = sorted(courses, key=lambda c: c.time)
-                for course in sorted_courses:
-                    body += f"│ {course.time:15} │ {course.course_id:8} │ {course.name[:42]:42} │\n"
-                    body += f"│                 │          │ {course.instructor[:42]:42} │\n"
-                    body += f"│                 │          │ {course.location[:42]:42} │\n"
+                # Already in start-time order
+                for course in courses:
+                    parts.append(f"│ {course.time:15} │ {course.course_id:8} │ {course.name[:42]:42} │\n"
+                                 f"│                 │          │ {course.instructor[:42]:42} │\n"
+                                 f"│                 │          │ {course.location[:42]:42} │\n")
             else:
-                body += "│                           No classes scheduled                           │\n"
+                parts.append("│                           No classes scheduled                           │\n")
 
-            body += "└" + "─" * 78 + "┘\n\n"
+            parts.append(BOX_BOTTOM)
 
-        return header + body
+        return ''.join(parts)
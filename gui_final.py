@@ -15,14 +15,44 @@ Author: Lleyton
 Date: 10/24/2025
 """
 
+import atexit
+import os
+import tempfile
+import threading
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import messagebox
 from enrollment_system import EnrollmentSystem
 
+# Browse cards sit in fixed-height rows so the visible range can be computed
+# from the scroll offset; only cards in that range exist as widgets
+BROWSE_ROW_HEIGHT = 150
+BROWSE_ROW_GAP = 24
+
+# Characters written to the print-schedule Text widget per idle callback
+SCHEDULE_CHUNK_CHARS = 1024
+
+# How long a card's Drop button waits for the confirming second click
+DROP_CONFIRM_MS = 5000
+
 
 class RegistrationSystemGUI:
     """Beautiful modern GUI with polished design."""
 
+    # Fixed attribute set: no per-instance __dict__, faster attribute access in the card loops
+    __slots__ = ('root', 'auth_system', 'current_user', 'data_directory', 'system',
+                 '_load_error', '_load_thread', '_loading_label',
+                 'bg_color', 'primary_color', 'primary_hover', 'success_color', 'success_hover',
+                 'danger_color', 'danger_hover', 'card_bg', 'text_color', 'text_muted', 'border_color',
+                 'font_badge', 'font_button', 'font_body', 'font_body_bold', 'font_subtitle',
+                 'font_status', 'font_dialog_title', 'font_card_title', 'font_heading',
+                 'font_app_title', 'font_page_title', 'font_mono',
+                 'current_tab_btn', 'tab_buttons', 'content', '_tab_pages', '_active_canvas',
+                 'my_container', '_my_canvas', '_my_card_pool', '_my_cards', '_my_empty',
+                 'browse_container', '_browse_scrollbar', '_browse_card_pool', '_browse_cards',
+                 '_browse_rows', '_browse_row_index', '_browse_signature', '_enrolled_snapshot',
+                 '_pending_refresh', '_refresh_after_id', '_last_schedule_hash', '_last_temp_path')
+
     def __init__(self, root, auth_system, current_user, data_directory: str = "."):
         self.root = root
         self.auth_system = auth_system
@@ -30,12 +60,67 @@ class RegistrationSystemGUI:
         self.data_directory = data_directory
 
         self.setup_window()
-        self.system = EnrollmentSystem(data_directory)
-
-        if not self.system.courses:
-            self._initialize_sample_data()
+        self.system = None
+        self._load_error = None
 
         self.current_tab_btn = None
+        # Each tab's page is built on first visit and kept; switching tabs only
+        # swaps which page is packed. Containers stay None until their tab is built,
+        # so enroll/drop only patch cards of a tab that exists
+        self._tab_pages = {}
+        self.my_container = None
+        self.browse_container = None
+        self._enrolled_snapshot = frozenset()
+
+        # Course IDs whose cards need patching, applied together on the next idle pass
+        self._pending_refresh = set()
+        self._refresh_after_id = None
+
+        # Temp file handed to the print verb, reused while the schedule is unchanged
+        # and deleted at exit
+        self._last_schedule_hash = None
+        self._last_temp_path = None
+        atexit.register(self._remove_print_file)
+
+        # One wheel binding for the whole window (every widget's bindtags include
+        # the root), routed to whichever tab's canvas is showing
+        self._active_canvas = None
+        self.root.bind("<MouseWheel>", self._route_wheel)
+
+        # Paint a placeholder now and read the data files on a worker thread;
+        # the widgets are built once loading finishes
+        self._loading_label = tk.Label(
+            self.root,
+            text="Loading courses…",
+            font=self.font_status,
+            bg=self.bg_color,
+            fg=self.text_muted
+        )
+        self._loading_label.pack(expand=True)
+        self._load_thread = threading.Thread(target=self._load_system, daemon=True)
+        self._load_thread.start()
+        self.root.after(50, self._poll_system_load)
+
+    def _load_system(self):
+        """Load the enrollment data (runs on the worker thread, no Tk calls)."""
+        try:
+            self.system = EnrollmentSystem(self.data_directory)
+            if not self.system.courses:
+                self._initialize_sample_data()
+        except Exception as e:
+            self._load_error = e
+
+    def _poll_system_load(self):
+        """Build the widgets on the Tk thread once the worker has loaded the data."""
+        if self._load_thread.is_alive():
+            self.root.after(50, self._poll_system_load)
+            return
+        self._loading_label.destroy()
+
+        if self._load_error is not None:
+            print(f"Error loading enrollment data: {self._load_error}")
+            messagebox.showerror("Error", f"Could not load course data:\n{self._load_error}")
+            return
         self.create_widgets()
 
     def setup_window(self):
@@ -58,6 +143,21 @@ class RegistrationSystemGUI:
         self.text_muted = "#64748b"
         self.border_color = "#e2e8f0"
 
+        # Named fonts, created once and shared by every widget; resizing one
+        # (e.g. self.font_body.configure(size=12)) updates all its widgets
+        self.font_badge = tkfont.Font(family='Segoe UI', size=9, weight='bold')
+        self.font_button = tkfont.Font(family='Segoe UI', size=10, weight='bold')
+        self.font_body = tkfont.Font(family='Segoe UI', size=11)
+        self.font_body_bold = tkfont.Font(family='Segoe UI', size=11, weight='bold')
+        self.font_subtitle = tkfont.Font(family='Segoe UI', size=12)
+        self.font_status = tkfont.Font(family='Segoe UI', size=14)
+        self.font_dialog_title = tkfont.Font(family='Segoe UI', size=16, weight='bold')
+        self.font_card_title = tkfont.Font(family='Segoe UI', size=17, weight='bold')
+        self.font_heading = tkfont.Font(family='Segoe UI', size=18, weight='bold')
+        self.font_app_title = tkfont.Font(family='Segoe UI', size=20, weight='bold')
+        self.font_page_title = tkfont.Font(family='Segoe UI', size=26, weight='bold')
+        self.font_mono = tkfont.Font(family='Courier New', size=10)
+
         self.root.configure(bg=self.bg_color)
 
     def _initialize_sample_data(self):
@@ -71,8 +171,8 @@ class RegistrationSystemGUI:
             ("CS301", "Database Systems", "Dr. Garcia", 25),
             ("MATH301", "Linear Algebra", "Prof. Martinez", 30),
         ]
-        for cid, name, instructor, max_s in courses:
-            self.system.add_course(cid, name, instructor, max_s)
+        # One call, one write to disk for the whole catalog
+        self.system.add_courses(courses)
 
     def create_widgets(self):
         """Create all widgets."""
@@ -108,7 +208,7 @@ class RegistrationSystemGUI:
         btn = tk.Button(
             parent,
             text=text,
-            font=('Segoe UI', 11, 'bold'),
+            font=self.font_body_bold,
             bg=self.card_bg,
             fg=self.text_muted,
             relief=tk.FLAT,
@@ -153,7 +253,7 @@ class RegistrationSystemGUI:
         tk.Label(
             header,
             text="🎓 Banner Web",
-            font=('Segoe UI', 20, 'bold'),
+            font=self.font_app_title,
             bg=self.primary_color,
             fg='white'
         ).pack(side='left', padx=40, pady=25)
@@ -165,7 +265,7 @@ class RegistrationSystemGUI:
         tk.Label(
             right,
             text=f"👤 {self.current_user.username}",
-            font=('Segoe UI', 11),
+            font=self.font_body,
             bg=self.primary_color,
             fg='white'
         ).pack(side='left', padx=(0, 20))
@@ -173,7 +273,7 @@ class RegistrationSystemGUI:
         logout_btn = tk.Button(
             right,
             text="Logout",
-            font=('Segoe UI', 10, 'bold'),
+            font=self.font_button,
             bg='white',
             fg=self.primary_color,
             activebackground='#f1f5f9',
@@ -185,23 +285,49 @@ class RegistrationSystemGUI:
         )
         logout_btn.pack()
 
-    def clear_content(self):
-        """Clear content area."""
-        for widget in self.content.winfo_children():
-            widget.destroy()
+    def _show_page(self, tab_name, build):
+        """
+        Show a tab's page in the content area, building it on first use.
+
+        Args:
+            tab_name: Tab whose page to show
+            build: Callable that fills a new, empty page frame
+        """
+        page = self._tab_pages.get(tab_name)
+        if page is None:
+            page = self._tab_pages[tab_name] = tk.Frame(self.content, bg=self.bg_color)
+            build(page)
+
+        # Other pages are hidden, not destroyed
+        for other in self._tab_pages.values():
+            if other is not page:
+                other.pack_forget()
+        page.pack(fill='both', expand=True)
+
+    def _route_wheel(self, event):
+        """Scroll the current tab's canvas in response to the mouse wheel."""
+        if self._active_canvas is not None:
+            self._active_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
     def show_my_courses(self):
         """Show enrolled courses."""
-        self.clear_content()
+        self._show_page("my_courses", self._build_my_courses_page)
+
+        # Mouse wheel scrolling goes to this tab's canvas (see _route_wheel)
+        self._active_canvas = self._my_canvas
 
+        self.refresh_my_courses()
+
+    def _build_my_courses_page(self, page):
+        """Create the My Courses title bar and scrollable card container."""
         # Title bar
-        title_bar = tk.Frame(self.content, bg=self.bg_color)
+        title_bar = tk.Frame(page, bg=self.bg_color)
         title_bar.pack(fill='x', pady=(0, 25))
 
         tk.Label(
             title_bar,
             text="My Enrolled Courses",
-            font=('Segoe UI', 26, 'bold'),
+            font=self.font_page_title,
             bg=self.bg_color,
             fg=self.text_color
         ).pack(side='left')
@@ -209,7 +335,7 @@ class RegistrationSystemGUI:
         tk.Label(
             title_bar,
             text=f"Student ID: {self.current_user.student_id}",
-            font=('Segoe UI', 12),
+            font=self.font_subtitle,
             bg=self.bg_color,
             fg=self.text_muted
         ).pack(side='left', padx=20)
@@ -218,7 +344,7 @@ class RegistrationSystemGUI:
         print_btn = tk.Button(
             title_bar,
             text="🖨️ Print Schedule",
-            font=('Segoe UI', 11, 'bold'),
+            font=self.font_body_bold,
             bg=self.primary_color,
             fg='white',
             activebackground=self.primary_hover,
@@ -231,33 +357,25 @@ class RegistrationSystemGUI:
         print_btn.pack(side='right')
 
         # Scrollable container
-        canvas = tk.Canvas(self.content, bg=self.bg_color, highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.content, orient="vertical", command=canvas.yview)
+        canvas = tk.Canvas(page, bg=self.bg_color, highlightthickness=0)
+        scrollbar = tk.Scrollbar(page, orient="vertical", command=canvas.yview)
 
+        self._my_canvas = canvas
         self.my_container = tk.Frame(canvas, bg=self.bg_color)
+        # Card widgets live in the container for good; refresh_my_courses reuses them
+        self._my_card_pool = []
+        self._my_cards = {}
+        self._my_empty = None
         self.my_container.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
 
         canvas.create_window((0, 0), window=self.my_container, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
-        # Enable mouse wheel scrolling
-        def on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
-        self.my_container.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
-        self.my_container.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
-
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        self.refresh_my_courses()
-
     def refresh_my_courses(self):
-        """Refresh enrolled courses."""
-        for widget in self.my_container.winfo_children():
-            widget.destroy()
-
+        """Refresh enrolled courses, reusing pooled card widgets."""
         student_id = self.current_user.student_id
 
         if student_id not in self.system.students:
@@ -265,38 +383,86 @@ class RegistrationSystemGUI:
 
         student = self.system.students.get(student_id)
 
+        # Hide every card, then show the student's courses on the front of the pool
+        for card in self._my_card_pool:
+            self._cancel_drop_confirm(card)
+            card['outer'].pack_forget()
+        self._my_cards = {}
+
         if not student or not student.registered_courses:
-            # Empty state
-            empty = tk.Frame(self.my_container, bg=self.card_bg, relief=tk.FLAT)
-            empty.pack(fill='x', pady=15)
-
-            tk.Label(
-                empty,
-                text="📚 No courses enrolled yet",
-                font=('Segoe UI', 18, 'bold'),
-                bg=self.card_bg,
-                fg=self.text_muted
-            ).pack(pady=40)
-
-            tk.Label(
-                empty,
-                text="Go to 'Browse Courses' tab to start adding courses",
-                font=('Segoe UI', 12),
-                bg=self.card_bg,
-                fg=self.text_muted
-            ).pack(pady=(0, 40))
-        else:
-            # Course cards
-            for course_id in student.registered_courses:
-                if course_id in self.system.courses:
-                    course = self.system.courses[course_id]
-                    self.create_my_course_card(course)
-
-    def create_my_course_card(self, course):
-        """Create enrolled course card with smaller drop button."""
+            self._show_my_empty_state()
+            return
+
+        if self._my_empty is not None:
+            self._my_empty.pack_forget()
+
+        # Course cards
+        for course_id in student.registered_courses:
+            if course_id in self.system.courses:
+                self._append_my_card(self.system.courses[course_id])
+
+    def _append_my_card(self, course):
+        """Show a course on the next free pooled card, at the end of the list."""
+        visible = len(self._my_cards)
+        if visible == len(self._my_card_pool):
+            self._my_card_pool.append(self.create_my_course_card())
+        card = self._my_card_pool[visible]
+        self.fill_my_course_card(card, course)
+        card['outer'].pack(fill='x', pady=12)
+        self._my_cards[course.course_id] = card
+
+    def _remove_my_card(self, course_id):
+        """Hide one course's card and return it to the free end of the pool."""
+        card = self._my_cards.pop(course_id, None)
+        if card is None:
+            return
+        self._cancel_drop_confirm(card)
+        card['outer'].pack_forget()
+        # Visible cards stay at the front of the pool, in display order
+        self._my_card_pool.remove(card)
+        self._my_card_pool.append(card)
+        if not self._my_cards:
+            self._show_my_empty_state()
+
+    def _show_my_empty_state(self):
+        """Show the 'no courses' placeholder on the My Courses tab."""
+        if self._my_empty is None:
+            self._my_empty = self.create_my_empty_state()
+        self._my_empty.pack(fill='x', pady=15)
+
+    def create_my_empty_state(self):
+        """Create the 'no courses' placeholder for the My Courses tab."""
+        empty = tk.Frame(self.my_container, bg=self.card_bg, relief=tk.FLAT)
+
+        tk.Label(
+            empty,
+            text="📚 No courses enrolled yet",
+            font=self.font_heading,
+            bg=self.card_bg,
+            fg=self.text_muted
+        ).pack(pady=40)
+
+        tk.Label(
+            empty,
+            text="Go to 'Browse Courses' tab to start adding courses",
+            font=self.font_subtitle,
+            bg=self.card_bg,
+            fg=self.text_muted
+        ).pack(pady=(0, 40))
+        return empty
+
+    def create_my_course_card(self):
+        """
+        Create an empty enrolled-course card with a smaller drop button.
+
+        Returns:
+            Dict of the card's widgets, filled in by fill_my_course_card
+        """
+        card_widgets = {'course_id': None}
+
         # Card with shadow effect
         card_outer = tk.Frame(self.my_container, bg=self.bg_color)
-        card_outer.pack(fill='x', pady=12)
+        card_widgets['outer'] = card_outer
 
         card = tk.Frame(card_outer, bg=self.card_bg, relief=tk.SOLID, bd=1, highlightthickness=0, highlightbackground=self.border_color)
         card.pack(fill='x')
@@ -312,69 +478,39 @@ class RegistrationSystemGUI:
         top = tk.Frame(left, bg=self.card_bg)
         top.pack(fill='x', pady=(0, 12))
 
-        tk.Label(
+        card_widgets['id'] = tk.Label(
             top,
-            text=course.course_id,
-            font=('Segoe UI', 10, 'bold'),
+            font=self.font_button,
             bg=self.primary_color,
             fg='white',
             padx=10,
             pady=5
-        ).pack(side='left', padx=(0, 12))
+        )
+        card_widgets['id'].pack(side='left', padx=(0, 12))
 
-        tk.Label(
+        card_widgets['name'] = tk.Label(
             top,
-            text=course.name,
-            font=('Segoe UI', 17, 'bold'),
+            font=self.font_card_title,
             bg=self.card_bg,
             fg=self.text_color
-        ).pack(side='left')
-
-        # Details
-        details_frame = tk.Frame(left, bg=self.card_bg)
-        details_frame.pack(fill='x', pady=(5, 0))
+        )
+        card_widgets['name'].pack(side='left')
 
-        tk.Label(
-            details_frame,
-            text=f"👨‍🏫 {course.instructor}",
-            font=('Segoe UI', 11),
+        # Details: instructor and schedule in one pre-formatted label
+        card_widgets['details'] = tk.Label(
+            left,
+            font=self.font_body,
             bg=self.card_bg,
             fg=self.text_muted
-        ).pack(side='left', padx=(0, 20))
-
-        # Show schedule if available
-        if course.days and course.time:
-            tk.Label(
-                details_frame,
-                text=f"📅 {course.days}",
-                font=('Segoe UI', 11),
-                bg=self.card_bg,
-                fg=self.text_muted
-            ).pack(side='left', padx=(0, 15))
-
-            tk.Label(
-                details_frame,
-                text=f"🕐 {course.time}",
-                font=('Segoe UI', 11),
-                bg=self.card_bg,
-                fg=self.text_muted
-            ).pack(side='left', padx=(0, 15))
+        )
+        card_widgets['details'].pack(anchor='w', pady=(5, 0))
 
-            # Show location if available
-            if course.location:
-                tk.Label(
-                    details_frame,
-                    text=f"📍 {course.location}",
-                    font=('Segoe UI', 11),
-                    bg=self.card_bg,
-                    fg=self.text_muted
-                ).pack(side='left')
-
-        # Right - Smaller Drop button
+        # Right - Smaller Drop button (reads the card's current course when clicked);
+        # the first click asks for confirmation on the button itself
         drop_btn = tk.Button(
             inner,
             text="Drop",
-            font=('Segoe UI', 10, 'bold'),
+            font=self.font_button,
             bg=self.danger_color,
             fg='white',
             activebackground=self.danger_hover,
@@ -382,69 +518,263 @@ class RegistrationSystemGUI:
             cursor="hand2",
             padx=20,
             pady=8,
-            command=lambda c=course: self.drop_course(c.course_id)
+            command=lambda: self._begin_drop_confirm(card_widgets['course_id'])
         )
         drop_btn.pack(side='right')
+        card_widgets['drop'] = drop_btn
+
+        # Cancel button, packed beside Drop only while a drop awaits confirmation
+        card_widgets['cancel'] = tk.Button(
+            inner,
+            text="✕",
+            font=self.font_button,
+            bg=self.card_bg,
+            fg=self.text_muted,
+            activebackground=self.border_color,
+            relief=tk.FLAT,
+            cursor="hand2",
+            padx=10,
+            pady=8,
+            command=lambda: self._cancel_drop_confirm(card_widgets)
+        )
+        card_widgets['confirm_after'] = None
+        return card_widgets
+
+    def _begin_drop_confirm(self, course_id):
+        """
+        Handle a Drop click: ask for confirmation on the card, or drop if already asked.
+
+        Args:
+            course_id: ID of the course on the clicked card
+        """
+        card = self._my_cards.get(course_id)
+        if card is None:
+            return
+        if card['confirm_after'] is not None:
+            self._cancel_drop_confirm(card)
+            self.drop_course(course_id)
+            return
+
+        card['drop'].configure(text="Confirm?")
+        card['cancel'].pack(side='right', padx=(0, 8))
+        # Un-confirmed drops revert on their own
+        card['confirm_after'] = self.root.after(
+            DROP_CONFIRM_MS, self._cancel_drop_confirm, card)
+
+    def _cancel_all_drop_confirms(self):
+        """Stop pending drop confirmations before the My Courses cards are destroyed."""
+        if self.my_container is not None:
+            for card in self._my_card_pool:
+                self._cancel_drop_confirm(card)
+
+    def _cancel_drop_confirm(self, card):
+        """Return a card's Drop button to its normal state."""
+        if card['confirm_after'] is None:
+            return
+        self.root.after_cancel(card['confirm_after'])
+        card['confirm_after'] = None
+        card['drop'].configure(text="Drop")
+        card['cancel'].pack_forget()
+
+    def fill_my_course_card(self, card, course):
+        """Show a course's details on a pooled enrolled-course card."""
+        # Skip every Tcl call if the card already shows exactly this data
+        shown = (course.course_id, course.name, course.instructor,
+                 course.days, course.time, course.location)
+        if card.get('shown') == shown:
+            return
+        card['shown'] = shown
+
+        card['course_id'] = course.course_id
+        card['id'].configure(text=course.course_id)
+        card['name'].configure(text=course.name)
+        card['details'].configure(text=self._details_text(
+            course.instructor, course.days, course.time, course.location))
+
+    def _details_text(self, instructor, days, time, location, count_text=None):
+        """
+        Compose a card's details line: instructor, optional count, then schedule.
+
+        Args:
+            instructor: Course instructor
+            days: Meeting days (may be empty)
+            time: Meeting time (may be empty)
+            location: Building and room (may be empty)
+            count_text: Enrollment count to show after the instructor, if any
+
+        Returns:
+            Single line of emoji-prefixed details
+        """
+        parts = [f"👨‍🏫 {instructor}"]
+        if count_text is not None:
+            parts.append(f"📊 {count_text}")
+
+        # Show schedule if available
+        if days and time:
+            parts.append(f"📅 {days}")
+            parts.append(f"🕐 {time}")
+
+            # Show location if available
+            if location:
+                parts.append(f"📍 {location}")
+        return "    ".join(parts)
 
     def show_browse(self):
         """Show browse & enroll."""
-        self.clear_content()
+        self._show_page("browse", self._build_browse_page)
+
+        # Mouse wheel scrolling goes to this tab's canvas (see _route_wheel)
+        self._active_canvas = self.browse_container
 
+        self.refresh_browse()
+
+    def _build_browse_page(self, page):
+        """Create the Browse title bar and the canvas the virtual card list is drawn on."""
         # Title bar
-        title_bar = tk.Frame(self.content, bg=self.bg_color)
+        title_bar = tk.Frame(page, bg=self.bg_color)
         title_bar.pack(fill='x', pady=(0, 25))
 
         tk.Label(
             title_bar,
             text="Browse Courses",
-            font=('Segoe UI', 26, 'bold'),
+            font=self.font_page_title,
             bg=self.bg_color,
             fg=self.text_color
         ).pack(side='left')
 
-        # Scrollable
-        canvas = tk.Canvas(self.content, bg=self.bg_color, highlightthickness=0)
-        scrollbar = tk.Scrollbar(self.content, orient="vertical", command=canvas.yview)
-
-        self.browse_container = tk.Frame(canvas, bg=self.bg_color)
-        self.browse_container.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-
-        canvas.create_window((0, 0), window=self.browse_container, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Enable mouse wheel scrolling
-        def on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
-        self.browse_container.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
-        self.browse_container.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
+        # Scrollable: cards are canvas windows placed row by row (virtual list)
+        canvas = tk.Canvas(page, bg=self.bg_color, highlightthickness=0)
+        scrollbar = tk.Scrollbar(page, orient="vertical", command=canvas.yview)
+
+        self.browse_container = canvas
+        self._browse_scrollbar = scrollbar
+        self._browse_card_pool = []
+        self._browse_cards = {}
+        # One plain tuple per course, sorted by course ID (see _browse_row);
+        # the card loops read these instead of Course attributes
+        self._browse_rows = []
+        self._browse_row_index = {}
+        # (course count, enrolled IDs) the rows were last built for
+        self._browse_signature = None
+
+        # Every view change (wheel, scrollbar, resize) reports here, so it
+        # also drives rendering of the rows that came into view
+        canvas.configure(yscrollcommand=self._on_browse_scroll)
+        canvas.bind("<Configure>", lambda e: self._render_visible_browse())
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        self.refresh_browse()
-
     def refresh_browse(self):
-        """Refresh browse."""
-        for widget in self.browse_container.winfo_children():
-            widget.destroy()
-
-        student_id = self.current_user.student_id
-        enrolled_courses = set()
-
-        if student_id in self.system.students:
-            enrolled_courses = self.system.students[student_id].registered_courses
-
-        for course in self.system.courses.values():
-            is_enrolled = course.course_id in enrolled_courses
-            self.create_browse_card(course, is_enrolled)
-
-    def create_browse_card(self, course, is_enrolled):
-        """Create browse course card."""
-        # Card
+        """Refresh browse: size the scroll area for every course, render only visible rows."""
+        enrolled_courses = self._snapshot_enrolled()
+        # Nothing to redo if neither the catalog nor the student's courses changed
+        signature = (len(self.system.courses), enrolled_courses)
+        if signature == self._browse_signature:
+            return
+        self._browse_signature = signature
+
+        self._browse_rows = [self._browse_row(course) for course in
+                             sorted(self.system.courses.values(), key=lambda c: c.course_id)]
+        self._browse_row_index = {row[0]: i for i, row in enumerate(self._browse_rows)}
+        canvas = self.browse_container
+        canvas.configure(scrollregion=(0, 0, canvas.winfo_width(),
+                                       BROWSE_ROW_HEIGHT * len(self._browse_rows)))
+        self._render_visible_browse()
+
+    def _browse_row(self, course):
+        """
+        Capture the fields a browse card shows for one course.
+
+        Args:
+            course: Course to capture
+
+        Returns:
+            Tuple of (course_id, name, instructor, days, time, location,
+            enrolled count, max students, is full)
+        """
+        return (course.course_id, course.name, course.instructor, course.days, course.time,
+                course.location, course.get_enrollment_count(), course.max_students,
+                course.is_full())
+
+    def _on_browse_scroll(self, first, last):
+        """Update the scrollbar and render rows newly scrolled into view."""
+        self._browse_scrollbar.set(first, last)
+        self._render_visible_browse()
+
+    def _render_visible_browse(self):
+        """Place pooled cards on the rows inside the viewport and hide the rest."""
+        canvas = self.browse_container
+        if canvas is None:
+            return
+        rows = self._browse_rows
+        width = canvas.winfo_width()
+        top = int(canvas.canvasy(0))
+        first = max(0, top // BROWSE_ROW_HEIGHT)
+        last = min(len(rows), (top + canvas.winfo_height()) // BROWSE_ROW_HEIGHT + 1)
+
+        while len(self._browse_card_pool) < last - first:
+            self._browse_card_pool.append(self.create_browse_card())
+        pool_size = len(self._browse_card_pool)
+
+        # Row i always uses card i % pool_size, so rows that stay in view
+        # while scrolling keep their card and need no refill
+        enrolled_courses = self._enrolled_snapshot
+        self._browse_cards = {}
+        for i in range(first, last):
+            row = rows[i]
+            card = self._browse_card_pool[i % pool_size]
+            self.fill_browse_card(card, row, row[0] in enrolled_courses)
+            canvas.coords(card['window'], 0, i * BROWSE_ROW_HEIGHT + BROWSE_ROW_GAP // 2)
+            canvas.itemconfigure(card['window'], state='normal', width=width)
+            self._browse_cards[row[0]] = card
+
+        # Off-screen cards are hidden, not destroyed
+        in_view = {i % pool_size for i in range(first, last)}
+        for j, card in enumerate(self._browse_card_pool):
+            if j not in in_view:
+                canvas.itemconfigure(card['window'], state='hidden')
+
+    def _update_browse_card(self, course_id):
+        """Update the one browse row whose course or enrollment changed and redraw its card."""
+        enrolled_courses = self._snapshot_enrolled()
+        self._browse_signature = (len(self.system.courses), enrolled_courses)
+        i = self._browse_row_index.get(course_id)
+        course = self.system.courses.get(course_id)
+        if i is None or course is None:
+            return
+        row = self._browse_rows[i] = self._browse_row(course)
+        card = self._browse_cards.get(course_id)
+        if card is not None:
+            self.fill_browse_card(card, row, course_id in enrolled_courses)
+
+    def _snapshot_enrolled(self):
+        """
+        Record the logged-in student's registered course IDs for the card loops.
+
+        Returns:
+            Frozen set of course IDs (empty if the student isn't registered)
+        """
+        student = self.system.students.get(self.current_user.student_id)
+        self._enrolled_snapshot = frozenset(student.registered_courses) if student else frozenset()
+        return self._enrolled_snapshot
+
+    def create_browse_card(self):
+        """
+        Create an empty browse course card.
+
+        Returns:
+            Dict of the card's widgets, filled in by fill_browse_card
+        """
+        card_widgets = {'course_id': None}
+
+        # Card, shown as a canvas window positioned by _render_visible_browse
         card_outer = tk.Frame(self.browse_container, bg=self.bg_color)
-        card_outer.pack(fill='x', pady=12)
+        card_widgets['outer'] = card_outer
+        card_widgets['window'] = self.browse_container.create_window(
+            0, 0, window=card_outer, anchor='nw', state='hidden',
+            height=BROWSE_ROW_HEIGHT - BROWSE_ROW_GAP
+        )
 
         card = tk.Frame(card_outer, bg=self.card_bg, relief=tk.SOLID, bd=1, highlightthickness=0, highlightbackground=self.border_color)
         card.pack(fill='x')
@@ -456,34 +786,29 @@ class RegistrationSystemGUI:
         right = tk.Frame(inner, bg=self.card_bg)
         right.pack(side='right', padx=(15, 0))
 
-        # Status in right frame
-        if is_enrolled:
-            # Enrolled badge
-            tk.Label(
-                right,
-                text="✓ Enrolled",
-                font=('Segoe UI', 9, 'bold'),
-                bg=self.success_color,
-                fg='white',
-                padx=10,
-                pady=5
-            ).pack(side='top', anchor='e')
-        elif not course.is_full():
-            # Enroll button (if not enrolled and not full)
-            enroll_btn = tk.Button(
-                right,
-                text="Enroll",
-                font=('Segoe UI', 10, 'bold'),
-                bg=self.success_color,
-                fg='white',
-                activebackground=self.success_hover,
-                relief=tk.FLAT,
-                cursor="hand2",
-                padx=20,
-                pady=10,
-                command=lambda c=course: self.enroll_course(c.course_id)
-            )
-            enroll_btn.pack(side='top', anchor='e')
+        # Enrolled badge and Enroll button; fill_browse_card packs at most one
+        card_widgets['badge'] = tk.Label(
+            right,
+            text="✓ Enrolled",
+            font=self.font_badge,
+            bg=self.success_color,
+            fg='white',
+            padx=10,
+            pady=5
+        )
+        card_widgets['enroll'] = tk.Button(
+            right,
+            text="Enroll",
+            font=self.font_button,
+            bg=self.success_color,
+            fg='white',
+            activebackground=self.success_hover,
+            relief=tk.FLAT,
+            cursor="hand2",
+            padx=20,
+            pady=10,
+            command=lambda: self.enroll_course(card_widgets['course_id'])
+        )
 
         # Left - Course info
         left = tk.Frame(inner, bg=self.card_bg)
@@ -493,71 +818,58 @@ class RegistrationSystemGUI:
         top = tk.Frame(left, bg=self.card_bg)
         top.pack(fill='x', pady=(0, 12))
 
-        tk.Label(
+        card_widgets['id'] = tk.Label(
             top,
-            text=course.course_id,
-            font=('Segoe UI', 10, 'bold'),
+            font=self.font_button,
             bg=self.primary_color,
             fg='white',
             padx=10,
             pady=5
-        ).pack(side='left', padx=(0, 12))
+        )
+        card_widgets['id'].pack(side='left', padx=(0, 12))
 
-        tk.Label(
+        card_widgets['name'] = tk.Label(
             top,
-            text=course.name,
-            font=('Segoe UI', 17, 'bold'),
+            font=self.font_card_title,
             bg=self.card_bg,
             fg=self.text_color
-        ).pack(side='left')
-
-        # Details
-        details = tk.Frame(left, bg=self.card_bg)
-        details.pack(fill='x')
+        )
+        card_widgets['name'].pack(side='left')
 
-        tk.Label(
-            details,
-            text=f"👨‍🏫 {course.instructor}",
-            font=('Segoe UI', 11),
+        # Details: instructor, enrollment count and schedule in one pre-formatted label
+        card_widgets['details'] = tk.Label(
+            left,
+            font=self.font_body,
             bg=self.card_bg,
             fg=self.text_muted
-        ).pack(side='left', padx=(0, 25))
+        )
+        card_widgets['details'].pack(anchor='w')
+        return card_widgets
+
+    def fill_browse_card(self, card, row, is_enrolled):
+        """Show a browse row's details and enrollment status on a pooled browse card."""
+        # Skip every Tcl call if the card already shows exactly this data
+        shown = (row, is_enrolled)
+        if card.get('shown') == shown:
+            return
+        card['shown'] = shown
 
-        tk.Label(
-            details,
-            text=f"📊 {len(course.enrolled_students)}/{course.max_students}",
-            font=('Segoe UI', 11),
-            bg=self.card_bg,
-            fg=self.text_muted
-        ).pack(side='left', padx=(0, 25))
+        course_id, name, instructor, days, time, location, count, max_students, is_full = row
+        card['course_id'] = course_id
 
-        # Show schedule if available
-        if course.days and course.time:
-            tk.Label(
-                details,
-                text=f"📅 {course.days}",
-                font=('Segoe UI', 11),
-                bg=self.card_bg,
-                fg=self.text_muted
-            ).pack(side='left', padx=(0, 15))
-
-            tk.Label(
-                details,
-                text=f"🕐 {course.time}",
-                font=('Segoe UI', 11),
-                bg=self.card_bg,
-                fg=self.text_muted
-            ).pack(side='left', padx=(0, 15))
+        # Status in right frame
+        card['badge'].pack_forget()
+        card['enroll'].pack_forget()
+        if is_enrolled:
+            card['badge'].pack(side='top', anchor='e')
+        elif not is_full:
+            # Enroll button (if not enrolled and not full)
+            card['enroll'].pack(side='top', anchor='e')
 
-            # Show location if available
-            if course.location:
-                tk.Label(
-                    details,
-                    text=f"📍 {course.location}",
-                    font=('Segoe UI', 11),
-                    bg=self.card_bg,
-                    fg=self.text_muted
-                ).pack(side='left')
+        card['id'].configure(text=course_id)
+        card['name'].configure(text=name)
+        card['details'].configure(text=self._details_text(
+            instructor, days, time, location, f"{count}/{max_students}"))
 
     def enroll_course(self, course_id):
         """Enroll in course."""
@@ -580,26 +892,58 @@ class RegistrationSystemGUI:
 
         if success:
             messagebox.showinfo("Success", f"Enrolled in {course_id}")
-            self.refresh_my_courses()
-            self.refresh_browse()
+            # Only the enrolled course changed: patch its cards instead of rebuilding
+            self._schedule_refresh(course_id)
         else:
             messagebox.showerror("Error", message)
 
     def drop_course(self, course_id):
-        """Drop course."""
-        if not messagebox.askyesno("Confirm Drop", f"Drop course {course_id}?"):
-            return
-
+        """Drop course (already confirmed on the card)."""
         student_id = self.current_user.student_id
         success, message = self.system.drop_course(student_id, course_id)
 
         if success:
             messagebox.showinfo("✅ Success", message)
-            # Auto-refresh to show updated state
-            self.show_my_courses()
+            # Only the dropped course changed: patch its cards instead of rebuilding
+            self._schedule_refresh(course_id)
         else:
             messagebox.showerror("❌ Error", message)
 
+    def _schedule_refresh(self, course_id):
+        """
+        Queue a course's cards for patching on the next idle pass.
+
+        Several enroll/drop actions before Tk goes idle are applied together,
+        and each course's cards are patched at most once.
+
+        Args:
+            course_id: ID of the course whose enrollment changed
+        """
+        self._pending_refresh.add(course_id)
+        if self._refresh_after_id is None:
+            self._refresh_after_id = self.root.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        """Patch the cards of every queued course on each tab that has been built."""
+        self._refresh_after_id = None
+        pending, self._pending_refresh = self._pending_refresh, set()
+
+        if self.my_container is not None:
+            student = self.system.students.get(self.current_user.student_id)
+            registered = student.registered_courses if student else set()
+            for course_id in pending:
+                if course_id in registered and course_id in self.system.courses:
+                    if course_id not in self._my_cards:
+                        if self._my_empty is not None:
+                            self._my_empty.pack_forget()
+                        self._append_my_card(self.system.courses[course_id])
+                else:
+                    self._remove_my_card(course_id)
+
+        if self.browse_container is not None:
+            for course_id in pending:
+                self._update_browse_card(course_id)
+
     def show_print_schedule(self):
         """Display printable schedule in a new window."""
         student_id = self.current_user.student_id
@@ -621,7 +965,7 @@ class RegistrationSystemGUI:
         tk.Label(
             header,
             text="📅 Student Course Schedule",
-            font=('Segoe UI', 16, 'bold'),
+            font=self.font_dialog_title,
             bg=self.primary_color,
             fg='white'
         ).pack(side='left', padx=30, pady=15)
@@ -634,7 +978,7 @@ class RegistrationSystemGUI:
         print_btn = tk.Button(
             btn_frame,
             text="🖨️ Print",
-            font=('Segoe UI', 10, 'bold'),
+            font=self.font_button,
             bg='white',
             fg=self.primary_color,
             activebackground='#f1f5f9',
@@ -650,7 +994,7 @@ class RegistrationSystemGUI:
         close_btn = tk.Button(
             btn_frame,
             text="Close",
-            font=('Segoe UI', 10, 'bold'),
+            font=self.font_button,
             bg='white',
             fg=self.primary_color,
             activebackground='#f1f5f9',
@@ -671,13 +1015,15 @@ class RegistrationSystemGUI:
 
         text_widget = tk.Text(
             text_frame,
-            font=('Courier New', 10),
+            font=self.font_mono,
             bg='white',
             fg='#1e293b',
             wrap=tk.NONE,
             yscrollcommand=scrollbar.set,
             padx=15,
-            pady=15
+            pady=15,
+            undo=False,  # read-only view: no undo stack
+            state='disabled'
         )
         text_widget.pack(side='left', fill='both', expand=True)
         scrollbar.config(command=text_widget.yview)
@@ -689,24 +1035,60 @@ class RegistrationSystemGUI:
 
         text_widget.bind("<MouseWheel>", on_text_mousewheel)
 
-        # Insert schedule text
-        text_widget.insert('1.0', schedule_text)
-        text_widget.config(state='disabled')  # Make read-only
+        # Insert schedule text in idle-time chunks so a long schedule doesn't block the window
+        self._insert_text_chunks(text_widget, schedule_text, 0)
+
+    def _insert_text_chunks(self, text_widget, text, start):
+        """
+        Append the next chunk of text to a read-only Text widget, then reschedule.
+
+        Chunks end on a line break where possible so each insert lays out whole lines.
+
+        Args:
+            text_widget: Disabled Text widget being filled
+            text: Full text to insert
+            start: Index in text of the next chunk
+        """
+        if start >= len(text) or not text_widget.winfo_exists():
+            return
+        end = start + SCHEDULE_CHUNK_CHARS
+        if end < len(text):
+            newline = text.rfind('\n', start, end)
+            if newline >= start:
+                end = newline + 1
+
+        # Writable only while inserting
+        text_widget.configure(state='normal')
+        text_widget.insert('end-1c', text[start:end])
+        text_widget.configure(state='disabled')
+        self.root.after_idle(self._insert_text_chunks, text_widget, text, end)
 
     def print_schedule_dialog(self, schedule_text):
         """Handle printing of schedule."""
         try:
-            # Try to open print dialog (Windows)
-            import tempfile
-            import os
-
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-                f.write(schedule_text)
-                temp_path = f.name
-
-            # Open with default text editor for printing
-            os.startfile(temp_path, 'print')
+            # Printing goes through the Windows shell print verb
+            if not hasattr(os, 'startfile'):
+                raise OSError("printing is only supported on Windows")
+
+            # Reuse the last temp file if the schedule hasn't changed since
+            schedule_hash = hash(schedule_text)
+            if schedule_hash != self._last_schedule_hash or not os.path.exists(self._last_temp_path or ""):
+                self._remove_print_file()
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
+                    f.write(schedule_text)
+                    self._last_temp_path = f.name
+                self._last_schedule_hash = schedule_hash
+
+            # The print verb can take seconds to reach the printer driver; keep it off the Tk thread
+            temp_path = self._last_temp_path
+
+            def _print():
+                try:
+                    os.startfile(temp_path, 'print')
+                except Exception as e:
+                    print(f"Error printing schedule: {e}")
+
+            threading.Thread(target=_print, daemon=True).start()
             messagebox.showinfo("Print", "Schedule sent to printer.\nA print dialog should open shortly.")
         except Exception as e:
             # Fallback: just show message
@@ -715,6 +1097,17 @@ class RegistrationSystemGUI:
                 "To print:\n1. Select all text (Ctrl+A)\n2. Copy (Ctrl+C)\n3. Paste into a text editor\n4. Print from there"
             )
 
+    def _remove_print_file(self):
+        """Delete the temp file written for the last print, if any."""
+        if self._last_temp_path is None:
+            return
+        try:
+            os.unlink(self._last_temp_path)
+        except OSError:
+            pass
+        self._last_temp_path = None
+        self._last_schedule_hash = None
+
     def logout(self):
         """Logout and return to login screen."""
         from login_ui import LoginWindow
@@ -722,6 +1115,20 @@ class RegistrationSystemGUI:
         # Logout from auth system
         self.auth_system.logout()
 
+        # Stop routing wheel events to this window's canvases
+        self.root.unbind("<MouseWheel>")
+        self._active_canvas = None
+
+        # Drop queued card patches and confirmations; their widgets are about to be destroyed
+        self._cancel_all_drop_confirms()
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        self._pending_refresh.clear()
+
+        # Write batched changes now; the next session reloads from disk
+        self.system.close()
+
         # Destroy all current widgets
         for widget in self.root.winfo_children():
             widget.destroy()
@@ -729,12 +1136,9 @@ class RegistrationSystemGUI:
         # Show login window again
         def on_login_success(auth_system, user):
             """Callback when user logs in again."""
-            # Clear the login window
-            for widget in self.root.winfo_children():
-                widget.destroy()
-            # Create new registration GUI
-            import os
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            RegistrationSystemGUI(self.root, auth_system, user, data_directory=script_dir)
-
-        LoginWindow(self.root, on_login_success)
+            # Clear the login window (all of it lives in one container frame)
+            login_window.container.destroy()
+            # Create new registration GUI on the same data files
+            RegistrationSystemGUI(self.root, auth_system, user, data_directory=self.data_directory)
+
+        login_window = LoginWindow(self.root, on_login_success, self.auth_system)
@@ -12,6 +12,7 @@ Date: 10/24/2025
 """
 
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import messagebox
 from auth import AuthenticationSystem, UserRole
 
@@ -19,10 +20,25 @@ from auth import AuthenticationSystem, UserRole
 class LoginWindow:
     """Login window that toggles between login and registration."""
 
-    def __init__(self, root, on_login_success):
+    # (widget attribute, text) for everything whose text changes with the mode
+    _LOGIN_STATE = (
+        ('subtitle_label', "Please login to continue"),
+        ('action_button', "LOGIN"),
+        ('toggle_text', "Don't have an account?"),
+        ('toggle_button', "CREATE ACCOUNT"),
+    )
+    _REGISTER_STATE = (
+        ('subtitle_label', "Create a new account"),
+        ('action_button', "REGISTER"),
+        ('toggle_text', "Already have an account?"),
+        ('toggle_button', "LOGIN"),
+    )
+
+    def __init__(self, root, on_login_success, auth_system=None):
         self.root = root
         self.on_login_success = on_login_success
-        self.auth_system = AuthenticationSystem()
+        # Reuse the caller's already-loaded accounts when given (e.g. after logout)
+        self.auth_system = auth_system if auth_system is not None else AuthenticationSystem()
         self.is_register_mode = False  # Start in login mode
 
         self.setup_window()
@@ -31,20 +47,32 @@ class LoginWindow:
     def setup_window(self):
         """Configure window."""
         self.root.title("Banner Web - Login")
-        self.root.geometry("750x1150")  # MAXIMUM size to show all buttons completely
+        # No fixed size: the window fits the form in one layout pass. Clear any
+        # size and minimum left behind by the main window after a logout.
+        self.root.geometry("")
+        self.root.minsize(1, 1)
         self.root.configure(bg="#f0f4f8")
 
+        # Named fonts, created once and shared by every widget on the login screen
+        self.font_title = tkfont.Font(family='Arial', size=24, weight='bold')
+        self.font_subtitle = tkfont.Font(family='Arial', size=11)
+        self.font_label = tkfont.Font(family='Arial', size=11, weight='bold')
+        self.font_body = tkfont.Font(family='Arial', size=12)
+        self.font_button = tkfont.Font(family='Arial', size=13, weight='bold')
+
     def create_widgets(self):
         """Create all widgets."""
-        # Main container
+        # Main container: the window's only top-level widget, so destroying
+        # it (see container) removes the whole login screen at once
         self.main = tk.Frame(self.root, bg="#f0f4f8")
         self.main.pack(fill='both', expand=True, padx=50, pady=20)
+        self.container = self.main
 
         # Title
         self.title_label = tk.Label(
             self.main,
             text="Banner Web",
-            font=('Arial', 24, 'bold'),
+            font=self.font_title,
             bg="#f0f4f8",
             fg="#1f2937"
         )
@@ -53,7 +81,7 @@ class LoginWindow:
         self.subtitle_label = tk.Label(
             self.main,
             text="Please login to continue",
-            font=('Arial', 11),
+            font=self.font_subtitle,
             bg="#f0f4f8",
             fg="#6b7280"
         )
@@ -67,31 +95,45 @@ class LoginWindow:
         self.form_inner.pack(padx=40, pady=25)
 
         # Username
-        tk.Label(self.form_inner, text="Username", font=('Arial', 11, 'bold'), bg="white", anchor='w').pack(fill='x', pady=(0, 5))
-        self.username_entry = tk.Entry(self.form_inner, font=('Arial', 12), width=40)
+        tk.Label(self.form_inner, text="Username", font=self.font_label, bg="white", anchor='w').pack(fill='x', pady=(0, 5))
+        self.username_entry = tk.Entry(self.form_inner, font=self.font_body, width=40)
         self.username_entry.pack(pady=(0, 15), ipady=8)
         self.username_entry.focus()
 
         # Password
-        tk.Label(self.form_inner, text="Password", font=('Arial', 11, 'bold'), bg="white", anchor='w').pack(fill='x', pady=(0, 5))
-        self.password_entry = tk.Entry(self.form_inner, font=('Arial', 12), show="*", width=40)
+        tk.Label(self.form_inner, text="Password", font=self.font_label, bg="white", anchor='w').pack(fill='x', pady=(0, 5))
+        self.password_entry = tk.Entry(self.form_inner, font=self.font_body, show="*", width=40)
         self.password_entry.pack(pady=(0, 15), ipady=8)
 
-        # Confirm Password (hidden initially, shown only in register mode)
-        self.confirm_label = tk.Label(self.form_inner, text="Confirm Password", font=('Arial', 11, 'bold'), bg="white", anchor='w')
-        self.confirm_entry = tk.Entry(self.form_inner, font=('Arial', 12), show="*", width=40)
+        # Confirm Password row (built once, frame packed only in register mode)
+        self.confirm_frame = tk.Frame(self.form_inner, bg="white")
+        self.confirm_label = tk.Label(self.confirm_frame, text="Confirm Password", font=self.font_label, bg="white", anchor='w')
+        self.confirm_label.pack(fill='x', pady=(0, 5))
+        self.confirm_entry = tk.Entry(self.confirm_frame, font=self.font_body, show="*", width=40)
+        self.confirm_entry.pack(pady=(0, 20), ipady=8)
 
         # Student ID (always visible)
-        self.student_id_label = tk.Label(self.form_inner, text="Student ID", font=('Arial', 11, 'bold'), bg="white", anchor='w')
+        self.student_id_label = tk.Label(self.form_inner, text="Student ID", font=self.font_label, bg="white", anchor='w')
         self.student_id_label.pack(fill='x', pady=(0, 5))
-        self.student_id_entry = tk.Entry(self.form_inner, font=('Arial', 12), width=40)
+        self.student_id_entry = tk.Entry(self.form_inner, font=self.font_body, width=40)
         self.student_id_entry.pack(pady=(0, 20), ipady=8)
 
+        # Validation errors (packed above the action button only while showing one)
+        self.error_label = tk.Label(
+            self.form_inner,
+            text="",
+            font=self.font_subtitle,
+            bg="white",
+            fg="#dc2626",
+            wraplength=400,
+            justify='left'
+        )
+
         # Primary Action Button (LOGIN or REGISTER)
         self.action_button = tk.Button(
             self.form_inner,
             text="LOGIN",
-            font=('Arial', 13, 'bold'),
+            font=self.font_button,
             bg="#2563eb",
             fg="white",
             command=self.handle_action,
@@ -109,7 +151,7 @@ class LoginWindow:
         self.toggle_text = tk.Label(
             self.form_inner,
             text="Don't have an account?",
-            font=('Arial', 12),
+            font=self.font_body,
             bg="white",
             fg="#6b7280"
         )
@@ -119,7 +161,7 @@ class LoginWindow:
         self.toggle_button = tk.Button(
             self.form_inner,
             text="CREATE ACCOUNT",
-            font=('Arial', 13, 'bold'),
+            font=self.font_button,
             bg="#2563eb",
             fg="white",
             command=self.toggle_mode,
@@ -129,13 +171,14 @@ class LoginWindow:
         )
         self.toggle_button.pack(fill='x', ipady=12, padx=0)
 
-        # Bind Enter key (initially for login mode)
+        # Bind Enter key once; the password field's handler checks the mode
         self.username_entry.bind('<Return>', lambda e: self.password_entry.focus())
-        self.password_entry.bind('<Return>', lambda e: self.student_id_entry.focus())
+        self.password_entry.bind('<Return>', self.handle_enter_from_password)
+        self.confirm_entry.bind('<Return>', lambda e: self.student_id_entry.focus())
         self.student_id_entry.bind('<Return>', lambda e: self.handle_action())
 
-    def handle_enter_from_password(self):
-        """Handle Enter key from password field."""
+    def handle_enter_from_password(self, event=None):
+        """Handle Enter key from password field (next field depends on the mode)."""
         if self.is_register_mode:
             self.confirm_entry.focus()
         else:
@@ -143,41 +186,38 @@ class LoginWindow:
 
     def toggle_mode(self):
         """Toggle between login and registration mode."""
-        self.is_register_mode = not self.is_register_mode
+        self.set_mode(not self.is_register_mode)
 
-        # Clear all fields
-        self.username_entry.delete(0, tk.END)
-        self.password_entry.delete(0, tk.END)
-        self.student_id_entry.delete(0, tk.END)
-        self.confirm_entry.delete(0, tk.END)
+    def set_mode(self, register: bool):
+        """
+        Switch to registration or login mode, doing nothing if already there.
 
-        if self.is_register_mode:
-            # Switch to registration mode
-            self.subtitle_label.config(text="Create a new account")
-            self.action_button.config(text="REGISTER")
-            self.toggle_text.config(text="Already have an account?")
-            self.toggle_button.config(text="LOGIN")
+        Args:
+            register: True for registration mode, False for login mode
+        """
+        if self.is_register_mode == register:
+            return
+        self.is_register_mode = register
 
-            # Show confirm password field BEFORE student ID label
-            self.confirm_label.pack(fill='x', pady=(0, 5), before=self.student_id_label)
-            self.confirm_entry.pack(pady=(0, 20), ipady=8, before=self.student_id_label)
+        self._clear_error()
 
-            # Update Enter key binding for register mode
-            self.password_entry.bind('<Return>', lambda e: self.confirm_entry.focus())
-            self.confirm_entry.bind('<Return>', lambda e: self.student_id_entry.focus())
-        else:
-            # Switch to login mode
-            self.subtitle_label.config(text="Please login to continue")
-            self.action_button.config(text="LOGIN")
-            self.toggle_text.config(text="Don't have an account?")
-            self.toggle_button.config(text="CREATE ACCOUNT")
+        # Clear all fields (empty ones need no Tk call)
+        for entry in (self.username_entry, self.password_entry,
+                      self.student_id_entry, self.confirm_entry):
+            if entry.get():
+                entry.delete(0, tk.END)
 
-            # Hide confirm password field
-            self.confirm_label.pack_forget()
-            self.confirm_entry.pack_forget()
+        # Switch every mode-dependent label and button in one pass
+        state = self._REGISTER_STATE if self.is_register_mode else self._LOGIN_STATE
+        for attr, text in state:
+            getattr(self, attr).configure(text=text)
 
-            # Update Enter key binding for login mode
-            self.password_entry.bind('<Return>', lambda e: self.student_id_entry.focus())
+        if self.is_register_mode:
+            # Show confirm password field BEFORE student ID label
+            self.confirm_frame.pack(fill='x', before=self.student_id_label)
+        else:
+            # Hide confirm password field
+            self.confirm_frame.pack_forget()
 
         self.username_entry.focus()
 
@@ -188,14 +228,25 @@ class LoginWindow:
         else:
             self.login()
 
+    def _collect_fields(self):
+        """
+        Read and strip the form fields, each exactly once.
+
+        Returns:
+            Tuple of (username, password, student_id, confirm); confirm is
+            None in login mode, where that field is hidden
+        """
+        confirm = self.confirm_entry.get().strip() if self.is_register_mode else None
+        return (self.username_entry.get().strip(), self.password_entry.get().strip(),
+                self.student_id_entry.get().strip(), confirm)
+
     def login(self):
         """Handle login."""
-        username = self.username_entry.get().strip()
-        password = self.password_entry.get().strip()
-        student_id = self.student_id_entry.get().strip()
+        self._clear_error()
+        username, password, student_id, _ = self._collect_fields()
 
-        if not username or not password or not student_id:
-            messagebox.showerror("Error", "Please fill in all fields!")
+        if not all((username, password, student_id)):
+            self._show_error("Please fill in all fields!")
             return
 
         success, message, user = self.auth_system.login(username, password)
@@ -203,30 +254,39 @@ class LoginWindow:
         if success:
             if not user.student_id:
                 # Check if this student ID is already taken by another user
-                for existing_user in self.auth_system.users.values():
-                    if existing_user.student_id == student_id and existing_user.username != username:
-                        messagebox.showerror("Error", f"Student ID {student_id} is already registered to another account.")
-                        return
+                if (owner := self.auth_system.student_id_index.get(student_id)) and owner != username:
+                    self._show_error(f"Student ID {student_id} is already registered to another account.")
+                    return
 
                 user.student_id = student_id
-                self.auth_system.save_users()
+                self.auth_system.student_id_index[student_id] = username
+                # Save once Tk is idle so the main window opens without waiting on disk
+                self.root.after_idle(self.auth_system.save_users)
             self.on_login_success(self.auth_system, user)
         else:
-            messagebox.showerror("Login Failed", message)
+            self._show_error(message)
+
+    def _show_error(self, message):
+        """Show a validation error inline above the action button."""
+        self.error_label.configure(text=message)
+        self.error_label.pack(fill='x', pady=(0, 15), before=self.action_button)
+
+    def _clear_error(self):
+        """Hide the inline error, if one is showing."""
+        if self.error_label.winfo_manager():
+            self.error_label.pack_forget()
 
     def register(self):
         """Handle registration."""
-        username = self.username_entry.get().strip()
-        password = self.password_entry.get().strip()
-        confirm = self.confirm_entry.get().strip()
-        student_id = self.student_id_entry.get().strip()
+        self._clear_error()
+        username, password, student_id, confirm = self._collect_fields()
 
-        if not username or not password or not student_id:
-            messagebox.showerror("Error", "All fields are required!")
+        if not all((username, password, student_id)):
+            self._show_error("All fields are required!")
             return
 
         if password != confirm:
-            messagebox.showerror("Error", "Passwords don't match!")
+            self._show_error("Passwords don't match!")
             return
 
         success, message = self.auth_system.register_user(username, password, UserRole.STUDENT, student_id)
@@ -234,9 +294,9 @@ class LoginWindow:
         if success:
             messagebox.showinfo("Success", "Account created successfully!")
             # Switch to login mode and pre-fill username and student ID
-            self.toggle_mode()
+            self.set_mode(False)
             self.username_entry.insert(0, username)
             self.student_id_entry.insert(0, student_id)
             self.password_entry.focus()
         else:
-            messagebox.showerror("Error", message)
+            self._show_error(message)
@@ -24,9 +24,38 @@ Date: 10/24/2025
 
 import tkinter as tk
 import os
+import sys
+from auth import AuthenticationSystem
 from login_ui import LoginWindow
 from gui_final import RegistrationSystemGUI
 
+# Directory of this script, where the CSV data files are stored
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+RULE = "=" * 80
+
+# Printed to the console on startup; {path} is the data directory
+STARTUP_BANNER = f"""{RULE}
+Banner Web - Student Version
+CS 236: Data Structures and Algorithms - Final Lab Assignment #5
+{RULE}
+
+Starting the application...
+Data files will be stored in: {{path}}
+
+To get started:
+   1. Create a new account with your Student ID
+   2. Or use the demo account:
+      Username: 'student', Password: 'student123', Student ID: 'S001'
+
+Features:
+   - View your enrolled courses
+   - Enroll in new courses
+   - Drop courses
+   - Browse all available courses
+{RULE}
+"""
+
 
 def on_login_success(auth_system, user):
     """
@@ -36,15 +65,11 @@ def on_login_success(auth_system, user):
         auth_system: The authentication system instance
         user: The logged-in user object
     """
-    # Close the login window
-    for widget in root.winfo_children():
-        widget.destroy()
-
-    # Get the directory where this script is located (for CSV file storage)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
+    # Close the login window (all of it lives in one container frame)
+    login_window.container.destroy()
 
     # Create and show the main application GUI
-    app = RegistrationSystemGUI(root, auth_system, user, data_directory=script_dir)
+    app = RegistrationSystemGUI(root, auth_system, user, data_directory=SCRIPT_DIR)
 
 
 def main():
@@ -57,13 +82,16 @@ def main():
     3. After successful login, shows the main application GUI
     4. Starts the GUI event loop
     """
-    global root
+    global root, login_window
 
     # Create the main window
     root = tk.Tk()
 
+    # Load user accounts once; logging out later reuses this instance
+    auth_system = AuthenticationSystem()
+
     # Show the login window
-    login_window = LoginWindow(root, on_login_success)
+    login_window = LoginWindow(root, on_login_success, auth_system)
 
     # Start the GUI event loop
     root.mainloop()
@@ -73,22 +101,8 @@ if __name__ == "__main__":
     """
     Entry point when the script is run directly.
     """
-    print("="*80)
-    print("Banner Web - Student Version")
-    print("CS 236: Data Structures and Algorithms - Final Lab Assignment #5")
-    print("="*80)
-    print("\nStarting the application...")
-    print(f"Data files will be stored in: {os.path.dirname(os.path.abspath(__file__))}")
-    print("\nTo get started:")
-    print("   1. Create a new account with your Student ID")
-    print("   2. Or use the demo account:")
-    print("      Username: 'student', Password: 'student123', Student ID: 'S001'")
-    print("\nFeatures:")
-    print("   - View your enrolled courses")
-    print("   - Enroll in new courses")
-    print("   - Drop courses")
-    print("   - Browse all available courses")
-    print("="*80)
+    sys.stdout.write(STARTUP_BANNER.format(path=SCRIPT_DIR))
+    sys.stdout.flush()
 
     # Run the main application
     main()
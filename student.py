@@ -10,7 +10,12 @@ Author: Gideon
 Date: 10/24/2025
 """
 
-from typing import Set
+import sys
+from typing import AbstractSet, Dict, List, Optional, Tuple
+
+# Shared, immutable course set of every student with no courses yet; add_course
+# swaps in a real set on first use, so unenrolled students allocate nothing
+NO_COURSES: AbstractSet[str] = frozenset()
 
 
 class Student:
@@ -24,6 +29,10 @@ class Student:
                                       Uses Set for O(1) membership testing
     """
 
+    # Fixed attribute set: no per-instance __dict__, smaller objects for large rosters
+    __slots__ = ('student_id', 'name', 'registered_courses',
+                 '_registered_csv', '_courses_str', '_busy_mask', '_weekly_schedule')
+
     def __init__(self, student_id: str, name: str):
         """
         Initialize a Student object.
@@ -32,28 +41,72 @@ class Student:
             student_id (str): Unique identifier for the student
             name (str): Name of the student
         """
-        self.student_id = student_id
+        # Interned so every copy of a Student ID shares one string object
+        self.student_id = sys.intern(student_id)
         self.name = name
         # Use Set for O(1) membership testing and automatic duplicate prevention
-        self.registered_courses: Set[str] = set()
-
-    def add_course(self, course_id: str) -> None:
+        # (NO_COURSES until the first course is added)
+        self.registered_courses: AbstractSet[str] = NO_COURSES
+        # ';'-joined course IDs for saving, rebuilt only after the courses change
+        self._registered_csv: Optional[str] = None
+        # ', '-joined course IDs for __str__ (set order, not sorted), rebuilt after a change
+        self._courses_str: Optional[str] = None
+        # OR of the registered courses' week masks, or None until recomputed
+        self._busy_mask: Optional[int] = None
+        # (scheduled course count, day key -> courses sorted by time) for the
+        # printable schedule, or None until rebuilt after a change
+        self._weekly_schedule: Optional[Tuple[int, Dict[str, List]]] = None
+
+    def add_course(self, course_id: str, week_mask: Optional[int] = None) -> None:
         """
         Add a course to the student's registered courses.
 
+        Idempotent (adding a registered course changes nothing), so callers
+        don't need to check is_enrolled_in first.
+
         Args:
             course_id: ID of the course to add
+            week_mask: The course's week mask, folded into the cached busy mask
+                       (the cache is cleared instead if this isn't given)
         """
-        self.registered_courses.add(course_id)
+        if self.registered_courses is NO_COURSES:
+            self.registered_courses = set()
+        self.registered_courses.add(sys.intern(course_id))
+        self._registered_csv = None
+        self._courses_str = None
+        self._weekly_schedule = None
+        if week_mask is None or self._busy_mask is None:
+            self._busy_mask = None
+        else:
+            self._busy_mask |= week_mask
 
     def remove_course(self, course_id: str) -> None:
         """
         Remove a course from the student's registered courses.
 
+        Idempotent: removing a course the student isn't registered for does nothing.
+
         Args:
             course_id: ID of the course to remove
         """
+        if self.registered_courses is NO_COURSES:
+            return
         self.registered_courses.discard(course_id)
+        self._registered_csv = None
+        self._courses_str = None
+        self._busy_mask = None
+        self._weekly_schedule = None
+
+    def get_registered_csv(self) -> str:
+        """
+        Get the registered course IDs as the ';'-separated string stored in students.csv.
+
+        Returns:
+            Course IDs joined with ';' (empty string if none)
+        """
+        if self._registered_csv is None:
+            self._registered_csv = ';'.join(self.registered_courses)
+        return self._registered_csv
 
     def get_course_count(self) -> int:
         """
@@ -78,8 +131,9 @@ class Student:
 
     def __str__(self) -> str:
         """String representation of the student."""
-        courses = ', '.join(self.registered_courses) if self.registered_courses else 'None'
-        return f"Student ID: {self.student_id}, Name: {self.name}, Courses: {courses}"
+        if self._courses_str is None:
+            self._courses_str = ', '.join(self.registered_courses) or 'None'
+        return f"Student ID: {self.student_id}, Name: {self.name}, Courses: {self._courses_str}"
 
     def __repr__(self) -> str:
         """Developer-friendly representation of the student."""